@@ -4,10 +4,15 @@ import asyncio
 import json
 import os
 import shutil
+import signal
 import subprocess
 import sys
-from abc import ABC, abstractmethod
+import uuid
+from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +21,106 @@ from .models import AgentRole
 # Windows compatibility
 IS_WINDOWS = sys.platform == "win32"
 
+# Fixed prompt section headers
+_CONTEXT_HEADER = "CONTEXT FROM OTHER AGENTS:\n"
+_TASK_HEADER = "YOUR TASK:\n"
+_CONTEXT_HEADER_BYTES = _CONTEXT_HEADER.encode("utf-8")
+_TASK_HEADER_BYTES = _TASK_HEADER.encode("utf-8")
+
+# Prompts longer than this are not passed on a command line (Windows caps
+# the whole command line at 32767 chars and cmd.exe at 8191)
+MAX_ARGV_PROMPT = 8000
+PROMPT_DIR = Path(".orchestra") / "prompts"
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Memoized shutil.which; call _which.cache_clear() after PATH changes."""
+    return shutil.which(name)
+
+
+def _gh_data_dir() -> Path:
+    """Resolve the gh CLI data directory the same way gh itself does."""
+    if os.environ.get("GH_DATA_DIR"):
+        return Path(os.environ["GH_DATA_DIR"])
+    if os.environ.get("XDG_DATA_HOME"):
+        return Path(os.environ["XDG_DATA_HOME"]) / "gh"
+    if IS_WINDOWS and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "GitHub CLI"
+    return Path.home() / ".local" / "share" / "gh"
+
+
+def _gh_extension_installed(name: str) -> bool:
+    """Check for an installed gh extension without starting gh if possible."""
+    extensions_dir = _gh_data_dir() / "extensions"
+    if extensions_dir.is_dir():
+        return (extensions_dir / name).exists()
+    # Unknown layout: ask gh itself
+    try:
+        result = subprocess.run(
+            ["gh", "extension", "list"],
+            capture_output=True,
+            timeout=5,
+            shell=IS_WINDOWS
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+    return result.returncode == 0 and name.encode() in result.stdout
+
+
+async def _spawn(
+    argv: tuple[str, ...],
+    cwd: Path,
+    pipe_stdin: bool = False,
+    spawn_sem: Optional[asyncio.Semaphore] = None,
+) -> asyncio.subprocess.Process:
+    """Start an agent CLI with captured output.
+
+    Every agent process is created here so spawn tuning applies to all CLIs
+    at once. CPython already uses vfork() for subprocesses on Linux (and
+    posix_spawn is ruled out by the cwd argument), so the remaining cost is
+    the CLI's own startup. Children never inherit our stdin, which under the
+    MCP server is the protocol stream. When spawn_sem is given, it bounds
+    how many spawns run at once. On POSIX each CLI leads its own session so
+    _kill() can take down any helpers it started along with it.
+    """
+    async with spawn_sem or nullcontext():
+        return await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=str(cwd),
+            stdin=asyncio.subprocess.PIPE if pipe_stdin else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=not IS_WINDOWS,
+        )
+
+
+def _kill(process: asyncio.subprocess.Process):
+    """Kill an agent process together with its process group.
+
+    wait() only returns once stdout and stderr reach EOF, so a child that
+    inherited the pipes would otherwise keep the caller blocked after the
+    CLI itself is gone.
+    """
+    try:
+        if IS_WINDOWS:
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def _reap(process: asyncio.subprocess.Process):
+    """Kill an unfinished agent process and wait for it so it can't linger."""
+    _kill(process)
+    await process.wait()
+
 
 @dataclass
 class AgentResponse:
@@ -26,70 +131,123 @@ class AgentResponse:
     error: Optional[str] = None
 
 
-class AgentInvoker(ABC):
-    """Base class for invoking AI agents."""
+class WarmProcessPool:
+    """Keeps pre-started agent CLI processes waiting for their prompt on stdin.
 
-    role: AgentRole
+    None of the agent CLIs can serve more than one prompt per process, so
+    instead of a long-lived worker the pool spawns the next process while
+    the current one is busy. Startup and auth then overlap with useful work
+    rather than sitting on the critical path of the next invocation.
+    """
 
-    @abstractmethod
-    async def invoke(self, prompt: str, context: Optional[str] = None) -> AgentResponse:
-        """Send a prompt to the agent and get a response."""
-        pass
+    def __init__(self, argv: tuple[str, ...], cwd: Path, size: int = 1):
+        self.argv = argv
+        self.cwd = cwd
+        self.size = size
+        self._spares: list[asyncio.subprocess.Process] = []
+        self._refill: Optional[asyncio.Task] = None
 
-    @abstractmethod
-    def is_available(self) -> bool:
-        """Check if this agent is available/configured."""
-        pass
+    async def _fill(self, spawn_sem: Optional[asyncio.Semaphore]):
+        try:
+            while len(self._spares) < self.size:
+                self._spares.append(
+                    await _spawn(self.argv, self.cwd, pipe_stdin=True, spawn_sem=spawn_sem)
+                )
+        except OSError:
+            pass  # CLI missing; the next acquire() will surface the error
 
+    def _schedule_refill(self, spawn_sem: Optional[asyncio.Semaphore]):
+        if self._refill is None or self._refill.done():
+            self._refill = asyncio.create_task(self._fill(spawn_sem))
 
-class GeminiAgent(AgentInvoker):
-    """Invoke Gemini CLI for code analysis and research."""
-
-    role = AgentRole.GEMINI
+    async def acquire(
+        self,
+        spawn_sem: Optional[asyncio.Semaphore] = None
+    ) -> asyncio.subprocess.Process:
+        """Take a warm process (or spawn one) that is waiting for its prompt."""
+        process = None
+        while self._spares:
+            spare = self._spares.pop(0)
+            if spare.returncode is None:
+                process = spare
+                break
+        if process is None:
+            # First use, or every spare died (EOF/crash): spawn on demand
+            process = await _spawn(self.argv, self.cwd, pipe_stdin=True, spawn_sem=spawn_sem)
+        self._schedule_refill(spawn_sem)
+        return process
+
+    async def close(self):
+        """Terminate all idle spares."""
+        if self._refill is not None:
+            self._refill.cancel()
+            self._refill = None
+        spares, self._spares = self._spares, []
+        for spare in spares:
+            if spare.returncode is None:
+                _kill(spare)
+                spare.stdin.close()
+                await spare.wait()
 
-    def __init__(self, working_dir: str = "."):
-        self.working_dir = Path(working_dir)
-        self.persona = """You are Gemini, the Researcher in a multi-agent AI team.
-Your role: Code analysis, research, verification, and providing context.
-You have a 1M+ token context window - use it for deep analysis.
 
-When responding:
-1. Be thorough but concise
-2. Provide file paths and line numbers when referencing code
-3. Include code excerpts for clarity
-4. Give actionable recommendations
+class AgentInvoker(ABC):
+    """Base class for invoking AI agents.
 
-You're working with:
-- Claude (Orchestrator): Plans and coordinates
-- Codex (Engineer): Implements complex features
-- Copilot (Engineer): Backend, Git, GitHub operations
+    Subclasses only describe their CLI (argv, timeout, persona and how the
+    prompt is delivered); spawning, timeouts and error handling live here.
+    """
 
-Always end your response with a clear summary of findings."""
+    role: AgentRole
+    persona: str
+    # Fixed command line; the prompt goes on stdin or is appended
+    _base_argv: tuple[str, ...]
+    # Seconds before the CLI is killed
+    _timeout: int = 300
+    # CLIs that read a piped stdin get their prompt there from a warm process
+    _stdin_prompt: bool = False
+    # Oversized argv prompts are written to a file the CLI is told to read
+    _prompt_file_fallback: bool = False
+    _available: Optional[bool] = None
+    # Set once an invocation succeeds, so callers can skip the probe
+    _assumed_available: bool = False
 
-    def is_available(self) -> bool:
-        """Check if Gemini CLI is available."""
-        return shutil.which("gemini") is not None
+    def __init__(self, working_dir: str = "."):
+        self.working_dir = Path(working_dir)
+        self._warm = (
+            WarmProcessPool(self._base_argv, self.working_dir)
+            if self._stdin_prompt else None
+        )
 
-    async def invoke(self, prompt: str, context: Optional[str] = None) -> AgentResponse:
-        """Invoke Gemini CLI with a prompt."""
-        full_prompt = f"{self.persona}\n\n"
-        if context:
-            full_prompt += f"CONTEXT FROM OTHER AGENTS:\n{context}\n\n"
-        full_prompt += f"YOUR TASK:\n{prompt}"
+    async def invoke(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        spawn_sem: Optional[asyncio.Semaphore] = None,
+    ) -> AgentResponse:
+        """Send a prompt to the agent and get a response."""
+        prompt_file = None
+        process = None
 
         try:
-            # Run gemini CLI
-            process = await asyncio.create_subprocess_exec(
-                "gemini",
-                full_prompt,
-                cwd=str(self.working_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=300  # 5 minute timeout
-            )
+            if self._warm is not None:
+                stdin = self._build_prompt(prompt, context)
+                process = await self._warm.acquire(spawn_sem)
+            else:
+                stdin = None
+                full_prompt = self._build_prompt_text(prompt, context)
+                if self._prompt_file_fallback and len(full_prompt) > MAX_ARGV_PROMPT:
+                    # Past the Windows command-line limit, point the CLI at
+                    # a file it can read instead
+                    prompt_file = await self._write_prompt_file(full_prompt)
+                    full_prompt = (
+                        f"Read {prompt_file.relative_to(self.working_dir).as_posix()} "
+                        "and follow the instructions in it exactly."
+                    )
+                process = await self._spawn(
+                    *self._resolve_argv(full_prompt), spawn_sem=spawn_sem
+                )
+            async with async_timeout(self._timeout):
+                stdout, stderr = await process.communicate(stdin)
 
             if process.returncode == 0:
                 return AgentResponse(
@@ -101,16 +259,20 @@ Always end your response with a clear summary of findings."""
                 return AgentResponse(
                     agent=self.role,
                     success=False,
-                    content="",
+                    content=stdout.decode("utf-8", errors="replace"),
                     error=stderr.decode("utf-8", errors="replace")
                 )
 
         except asyncio.TimeoutError:
+            await _reap(process)
             return AgentResponse(
                 agent=self.role,
                 success=False,
                 content="",
-                error="Gemini CLI timed out after 5 minutes"
+                error=(
+                    f"{self.role.value.capitalize()} CLI timed out after "
+                    f"{self._timeout // 60} minutes"
+                )
             )
         except Exception as e:
             return AgentResponse(
@@ -119,16 +281,115 @@ Always end your response with a clear summary of findings."""
                 content="",
                 error=str(e)
             )
+        finally:
+            if process is not None and process.returncode is None:
+                # Cancelled or interrupted mid-run. The CLI leads its own
+                # session, so the terminal's Ctrl-C never reached it
+                await _reap(process)
+            if prompt_file is not None:
+                prompt_file.unlink(missing_ok=True)
+
+    def _resolve_argv(self, prompt: str) -> tuple[str, ...]:
+        """Build the command line for an argv-prompt invocation."""
+        return (*self._base_argv, prompt)
+
+    def _probe(self) -> bool:
+        """Probe the system for this agent's CLI."""
+        return _which(self._base_argv[0]) is not None
+
+    def is_available(self) -> bool:
+        """Check if this agent is available/configured (probed once per instance)."""
+        if self._available is None:
+            self._available = self._probe()
+        return self._available
+
+    def _record_outcome(self, success: bool):
+        """Trust availability after a success; re-probe after a failure."""
+        self._assumed_available = success
+        if not success:
+            self._available = None
+
+    async def close(self):
+        """Release any processes held by this agent."""
+        if self._warm is not None:
+            await self._warm.close()
+
+    async def _spawn(
+        self,
+        *argv: str,
+        spawn_sem: Optional[asyncio.Semaphore] = None,
+    ) -> asyncio.subprocess.Process:
+        """Start this agent's CLI in its working directory."""
+        return await _spawn(argv, self.working_dir, spawn_sem=spawn_sem)
+
+    @cached_property
+    def _persona_prefix(self) -> str:
+        return self.persona + "\n\n"
+
+    @cached_property
+    def _persona_prefix_bytes(self) -> bytes:
+        return self._persona_prefix.encode("utf-8")
+
+    def _build_prompt(self, prompt: str, context: Optional[str] = None) -> bytes:
+        """Assemble persona, context and task as UTF-8 bytes for stdin."""
+        parts = [self._persona_prefix_bytes]
+        if context:
+            parts += (_CONTEXT_HEADER_BYTES, context.encode("utf-8"), b"\n\n")
+        parts += (_TASK_HEADER_BYTES, prompt.encode("utf-8"))
+        return b"".join(parts)
+
+    async def _write_prompt_file(self, text: str) -> Path:
+        """Write a prompt under the working directory for CLIs that read files."""
+        prompt_dir = self.working_dir / PROMPT_DIR
+        prompt_dir.mkdir(parents=True, exist_ok=True)
+        path = prompt_dir / f"{uuid.uuid4().hex}.txt"
+        await asyncio.to_thread(path.write_text, text, encoding="utf-8")
+        return path
+
+    def _build_prompt_text(self, prompt: str, context: Optional[str] = None) -> str:
+        """Assemble persona, context and task as a single argv string."""
+        parts = [self._persona_prefix]
+        if context:
+            parts += (_CONTEXT_HEADER, context, "\n\n")
+        parts += (_TASK_HEADER, prompt)
+        return "".join(parts)
+
+
+class GeminiAgent(AgentInvoker):
+    """Invoke Gemini CLI for code analysis and research."""
+
+    role = AgentRole.GEMINI
+    # Gemini reads the prompt from stdin when it is not a terminal
+    _base_argv = ("gemini",)
+    _stdin_prompt = True
+    persona = """You are Gemini, the Researcher in a multi-agent AI team.
+Your role: Code analysis, research, verification, and providing context.
+You have a 1M+ token context window - use it for deep analysis.
+
+When responding:
+1. Be thorough but concise
+2. Provide file paths and line numbers when referencing code
+3. Include code excerpts for clarity
+4. Give actionable recommendations
+
+You're working with:
+- Claude (Orchestrator): Plans and coordinates
+- Codex (Engineer): Implements complex features
+- Copilot (Engineer): Backend, Git, GitHub operations
+
+Always end your response with a clear summary of findings."""
 
 
 class CodexAgent(AgentInvoker):
     """Invoke OpenAI Codex CLI for implementation."""
 
     role = AgentRole.CODEX
-
-    def __init__(self, working_dir: str = "."):
-        self.working_dir = Path(working_dir)
-        self.persona = """You are Codex, Engineer #1 in a multi-agent AI team.
+    # Codex is interactive by default; quiet mode runs non-interactively
+    _base_argv = ("codex", "--quiet", "--approval-mode", "full-auto")
+    _timeout = 600  # 10 minute timeout for implementation
+    # Codex only takes the prompt in argv
+    _prompt_file_fallback = True
+    persona = """You are Codex, Engineer #1 in a multi-agent AI team.
 Your role: Implementation of features, complex algorithms, and UI work.
 
 When implementing:
@@ -144,72 +405,15 @@ You're working with:
 
 Report what you did, files modified, and any issues encountered."""
 
-    def is_available(self) -> bool:
-        """Check if Codex CLI is available."""
-        return shutil.which("codex") is not None
-
-    async def invoke(self, prompt: str, context: Optional[str] = None) -> AgentResponse:
-        """Invoke Codex CLI with a prompt."""
-        full_prompt = f"{self.persona}\n\n"
-        if context:
-            full_prompt += f"CONTEXT FROM OTHER AGENTS:\n{context}\n\n"
-        full_prompt += f"YOUR TASK:\n{prompt}"
-
-        try:
-            # Codex uses different invocation - it's interactive by default
-            # We'll use the quiet/non-interactive mode
-            process = await asyncio.create_subprocess_exec(
-                "codex",
-                "--quiet",
-                "--approval-mode", "full-auto",
-                full_prompt,
-                cwd=str(self.working_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=600  # 10 minute timeout for implementation
-            )
-
-            if process.returncode == 0:
-                return AgentResponse(
-                    agent=self.role,
-                    success=True,
-                    content=stdout.decode("utf-8", errors="replace")
-                )
-            else:
-                return AgentResponse(
-                    agent=self.role,
-                    success=False,
-                    content=stdout.decode("utf-8", errors="replace"),
-                    error=stderr.decode("utf-8", errors="replace")
-                )
-
-        except asyncio.TimeoutError:
-            return AgentResponse(
-                agent=self.role,
-                success=False,
-                content="",
-                error="Codex CLI timed out after 10 minutes"
-            )
-        except Exception as e:
-            return AgentResponse(
-                agent=self.role,
-                success=False,
-                content="",
-                error=str(e)
-            )
-
 
 class CopilotAgent(AgentInvoker):
     """Invoke GitHub Copilot CLI for backend and Git operations."""
 
     role = AgentRole.COPILOT
-
-    def __init__(self, working_dir: str = "."):
-        self.working_dir = Path(working_dir)
-        self.persona = """You are Copilot, Engineer #2 in a multi-agent AI team.
+    _base_argv = ("gh", "copilot", "suggest", "-t", "shell")
+    # Standalone Copilot CLI in non-interactive (prompt) mode
+    _standalone_argv = ("copilot", "-p")
+    persona = """You are Copilot, Engineer #2 in a multi-agent AI team.
 Your role: Backend implementation, Git operations, GitHub operations.
 
 Your specialties:
@@ -226,84 +430,31 @@ You're working with:
 
 Report what you did, commands run, and any issues encountered."""
 
-    def is_available(self) -> bool:
+    @cached_property
+    def _has_gh_copilot(self) -> bool:
+        return bool(_which("gh")) and _gh_extension_installed("gh-copilot")
+
+    def _probe(self) -> bool:
         """Check if Copilot CLI is available."""
-        # Check for gh with copilot extension
-        if shutil.which("gh"):
-            try:
-                result = subprocess.run(
-                    ["gh", "copilot", "--version"],
-                    capture_output=True,
-                    timeout=5,
-                    shell=IS_WINDOWS
-                )
-                if result.returncode == 0:
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-        # Check for standalone copilot
-        return shutil.which("copilot") is not None
-
-    async def invoke(self, prompt: str, context: Optional[str] = None) -> AgentResponse:
-        """Invoke Copilot CLI with a prompt."""
-        full_prompt = f"{self.persona}\n\n"
-        if context:
-            full_prompt += f"CONTEXT FROM OTHER AGENTS:\n{context}\n\n"
-        full_prompt += f"YOUR TASK:\n{prompt}"
+        # Check for gh with copilot extension, then standalone copilot
+        return self._has_gh_copilot or _which("copilot") is not None
 
-        try:
-            # Try gh copilot first, fall back to standalone
-            cmd = ["gh", "copilot", "suggest", "-t", "shell", full_prompt]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=str(self.working_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=300
-            )
-
-            if process.returncode == 0:
-                return AgentResponse(
-                    agent=self.role,
-                    success=True,
-                    content=stdout.decode("utf-8", errors="replace")
-                )
-            else:
-                return AgentResponse(
-                    agent=self.role,
-                    success=False,
-                    content=stdout.decode("utf-8", errors="replace"),
-                    error=stderr.decode("utf-8", errors="replace")
-                )
-
-        except asyncio.TimeoutError:
-            return AgentResponse(
-                agent=self.role,
-                success=False,
-                content="",
-                error="Copilot CLI timed out after 5 minutes"
-            )
-        except Exception as e:
-            return AgentResponse(
-                agent=self.role,
-                success=False,
-                content="",
-                error=str(e)
-            )
+    def _resolve_argv(self, prompt: str) -> tuple[str, ...]:
+        """Use gh copilot when installed, else fall back to standalone."""
+        if self._has_gh_copilot:
+            return (*self._base_argv, prompt)
+        return (*self._standalone_argv, prompt)
 
 
 class ClaudeAgent(AgentInvoker):
     """Invoke Claude Code CLI as a subagent."""
 
     role = AgentRole.CLAUDE
-
-    def __init__(self, working_dir: str = "."):
-        self.working_dir = Path(working_dir)
-        self.persona = """You are Claude, the Orchestrator in a multi-agent AI team.
+    # Print mode reads the prompt from stdin when none is given in argv
+    _base_argv = ("claude", "--print", "--dangerously-skip-permissions")
+    _timeout = 600
+    _stdin_prompt = True
+    persona = """You are Claude, the Orchestrator in a multi-agent AI team.
 Your role: Planning, coordination, final decisions, quality assurance.
 
 Your responsibilities:
@@ -320,86 +471,48 @@ You work with:
 
 Be decisive and keep the team moving forward."""
 
-    def is_available(self) -> bool:
-        """Check if Claude CLI is available."""
-        return shutil.which("claude") is not None
-
-    async def invoke(self, prompt: str, context: Optional[str] = None) -> AgentResponse:
-        """Invoke Claude Code CLI with a prompt."""
-        full_prompt = f"{self.persona}\n\n"
-        if context:
-            full_prompt += f"CONTEXT FROM OTHER AGENTS:\n{context}\n\n"
-        full_prompt += f"YOUR TASK:\n{prompt}"
-
-        try:
-            # Claude Code in print mode for non-interactive use
-            process = await asyncio.create_subprocess_exec(
-                "claude",
-                "--print",
-                "--dangerously-skip-permissions",
-                full_prompt,
-                cwd=str(self.working_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=600
-            )
-
-            if process.returncode == 0:
-                return AgentResponse(
-                    agent=self.role,
-                    success=True,
-                    content=stdout.decode("utf-8", errors="replace")
-                )
-            else:
-                return AgentResponse(
-                    agent=self.role,
-                    success=False,
-                    content=stdout.decode("utf-8", errors="replace"),
-                    error=stderr.decode("utf-8", errors="replace")
-                )
-
-        except asyncio.TimeoutError:
-            return AgentResponse(
-                agent=self.role,
-                success=False,
-                content="",
-                error="Claude CLI timed out after 10 minutes"
-            )
-        except Exception as e:
-            return AgentResponse(
-                agent=self.role,
-                success=False,
-                content="",
-                error=str(e)
-            )
-
 
 class AgentPool:
     """Pool of all available agents."""
 
+    # Agents are constructed on first use, so a caller that needs one role
+    # never pays for the other three
+    _factories: dict[AgentRole, type[AgentInvoker]] = {
+        AgentRole.CLAUDE: ClaudeAgent,
+        AgentRole.GEMINI: GeminiAgent,
+        AgentRole.CODEX: CodexAgent,
+        AgentRole.COPILOT: CopilotAgent,
+    }
+
     def __init__(self, working_dir: str = "."):
         self.working_dir = working_dir
-        self.agents: dict[AgentRole, AgentInvoker] = {
-            AgentRole.CLAUDE: ClaudeAgent(working_dir),
-            AgentRole.GEMINI: GeminiAgent(working_dir),
-            AgentRole.CODEX: CodexAgent(working_dir),
-            AgentRole.COPILOT: CopilotAgent(working_dir),
-        }
+        self._agents: dict[AgentRole, AgentInvoker] = {}
+        # Caps simultaneous CLI spawns across all agents (e.g. invoke_many
+        # fan-out plus review rounds)
+        self._spawn_sem = asyncio.Semaphore(os.cpu_count() or 4)
+
+    def _probe_all(self) -> dict[AgentRole, bool]:
+        """Check every agent's availability, running unprobed checks in parallel."""
+        agents = [self.get_agent(role) for role in self._factories]
+        unprobed = [agent for agent in agents if agent._available is None]
+        if unprobed:
+            with ThreadPoolExecutor(max_workers=len(unprobed)) as executor:
+                list(executor.map(AgentInvoker.is_available, unprobed))
+        return {agent.role: agent.is_available() for agent in agents}
 
     def get_agent(self, role: AgentRole) -> Optional[AgentInvoker]:
         """Get an agent by role."""
-        return self.agents.get(role)
+        agent = self._agents.get(role)
+        if agent is None:
+            factory = self._factories.get(role)
+            if factory is None:
+                return None
+            agent = self._agents[role] = factory(self.working_dir)
+        return agent
 
     def get_available_agents(self) -> list[AgentRole]:
         """Get list of available agents."""
-        available = []
-        for role, agent in self.agents.items():
-            if agent.is_available():
-                available.append(role)
-        return available
+        return [role for role, available in self._probe_all().items() if available]
 
     async def invoke(
         self,
@@ -417,7 +530,7 @@ class AgentPool:
                 error=f"Agent {role.value} not found"
             )
 
-        if not agent.is_available():
+        if not agent._assumed_available and not agent.is_available():
             return AgentResponse(
                 agent=role,
                 success=False,
@@ -425,11 +538,32 @@ class AgentPool:
                 error=f"Agent {role.value} is not available (CLI not found)"
             )
 
-        return await agent.invoke(prompt, context)
+        response = await agent.invoke(prompt, context, spawn_sem=self._spawn_sem)
+        agent._record_outcome(response.success)
+        return response
+
+    async def invoke_many(
+        self,
+        jobs: list[tuple[AgentRole, str, Optional[str]]]
+    ) -> list[AgentResponse]:
+        """Invoke several agents concurrently.
+
+        Each job is a (role, prompt, context) tuple. All processes are
+        dispatched up front and every agent applies its own timeout, so one
+        slow CLI never delays the others. Responses are returned in job order.
+        """
+        return await asyncio.gather(
+            *(self.invoke(role, prompt, context) for role, prompt, context in jobs)
+        )
+
+    async def close(self):
+        """Shut down warm processes held by the agents."""
+        for agent in self._agents.values():
+            await agent.close()
 
     def check_availability(self) -> dict[str, bool]:
         """Check availability of all agents."""
         return {
-            role.value: agent.is_available()
-            for role, agent in self.agents.items()
+            role.value: available
+            for role, available in self._probe_all().items()
         }
@@ -1,10 +1,13 @@
 """Configuration for Orchestra multi-agent system."""
 
 import json
-from dataclasses import dataclass, field
+import os
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 
 @dataclass
 class AgentConfig:
@@ -45,8 +48,24 @@ class OrchestraConfig:
 
     def save(self, path: str = "orchestra.json"):
         """Save configuration to file."""
-        with open(path, "w") as f:
-            json.dump(self.__dict__, f, indent=2, default=lambda x: x.__dict__)
+        Path(path).write_bytes(orjson.dumps(asdict(self), option=orjson.OPT_INDENT_2))
+
+
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """Settings the MCP server reads from its environment, resolved once."""
+    state_dir: str = ".orchestra"
+    agent: str = "claude"
+    pretty: bool = False
+
+    @classmethod
+    def from_env(cls) -> "EnvConfig":
+        """Read ORCHESTRA_STATE_DIR, ORCHESTRA_AGENT and ORCHESTRA_PRETTY."""
+        return cls(
+            state_dir=os.environ.get("ORCHESTRA_STATE_DIR", ".orchestra"),
+            agent=os.environ.get("ORCHESTRA_AGENT", "claude").lower(),
+            pretty=bool(os.environ.get("ORCHESTRA_PRETTY")),
+        )
 
 
 def generate_mcp_config() -> dict:
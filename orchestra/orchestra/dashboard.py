@@ -1,10 +1,10 @@
 """Orchestra Status Dashboard - Minimal CLI dashboard for orchestration status."""
 
 import argparse
+import asyncio
 import io
-import json
 import sys
-import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
@@ -12,27 +12,55 @@ from pathlib import Path
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
 
+import orjson
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn
 from rich.table import Table
 from rich.text import Text
+from watchfiles import awatch
+
+from .events import EVENTS_FILE, apply_events, file_key
+from .loop import run
 
 
 STATE_FILE = Path(".orchestra/state.json")
+EVENTS_PATH = STATE_FILE.parent / EVENTS_FILE
 REFRESH_INTERVAL = 2
+# Watch mode wakes at least this often while idle so the
+# "started N ago" label keeps moving
+AGE_REFRESH_MS = 60_000
+
+# (inode, mtime, size) of the last parsed snapshot and event log, and the
+# state they produced
+_cache: tuple[tuple, dict] | None = None
 
 
 def load_state() -> dict | None:
-    """Load orchestration state from .orchestra/state.json."""
-    if not STATE_FILE.exists():
+    """Load orchestration state from the .orchestra snapshot and event log.
+
+    The state is cached and only rebuilt when either file changes, so
+    repeated calls return the same dict object until then.
+    """
+    global _cache
+    snapshot_key = file_key(STATE_FILE)
+    if snapshot_key is None:
         return None
+    key = (snapshot_key, file_key(EVENTS_PATH))
+    if _cache is not None and _cache[0] == key:
+        return _cache[1]
     try:
-        with open(STATE_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        state = orjson.loads(STATE_FILE.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
         return None
+    if key[1] is not None:
+        try:
+            apply_events(state, EVENTS_PATH.read_bytes().splitlines())
+        except OSError:
+            pass  # log truncated/replaced mid-read; the next change reloads
+    _cache = (key, state)
+    return state
 
 
 def format_duration(start_time: str) -> str:
@@ -52,6 +80,14 @@ def format_duration(start_time: str) -> str:
         return "unknown"
 
 
+def _view_key(state: dict | None) -> tuple:
+    """Identify what render_dashboard would show for this state."""
+    if state is None:
+        return (None,)
+    started_at = state.get("started_at", "")
+    return (id(state), format_duration(started_at) if started_at else "unknown")
+
+
 def render_dashboard(state: dict | None) -> Panel:
     """Render the dashboard as a Rich Panel."""
     if state is None:
@@ -67,9 +103,11 @@ def render_dashboard(state: dict | None) -> Panel:
 
     # Count tasks by status
     tasks = state.get("tasks", [])
-    pending = sum(1 for t in tasks if t.get("status") in ("pending", "claimed"))
-    in_progress = sum(1 for t in tasks if t.get("status") == "in_progress")
-    completed = sum(1 for t in tasks if t.get("status") == "completed")
+    # Snapshots omit a task's status while it is still the default
+    counts = Counter(t.get("status", "pending") for t in tasks)
+    pending = counts["pending"] + counts["claimed"]
+    in_progress = counts["in_progress"]
+    completed = counts["completed"]
     total = len(tasks)
 
     # Build content
@@ -128,13 +166,40 @@ def render_dashboard(state: dict | None) -> Panel:
     )
 
 
+def _is_state_file(change, path: str) -> bool:
+    return Path(path).name in (STATE_FILE.name, EVENTS_FILE)
+
+
+async def _watch(console: Console):
+    """Re-render whenever the state snapshot or event log changes on disk."""
+    state = load_state()
+    with Live(render_dashboard(state), console=console, refresh_per_second=1) as live:
+        shown = _view_key(state)
+        # Nothing to watch until the orchestrator creates the state directory
+        while not STATE_FILE.parent.is_dir():
+            await asyncio.sleep(REFRESH_INTERVAL)
+        async for _ in awatch(
+            STATE_FILE.parent,
+            watch_filter=_is_state_file,
+            debounce=200,
+            rust_timeout=AGE_REFRESH_MS,
+            yield_on_timeout=True,
+            recursive=False,
+        ):
+            state = load_state()
+            # Skip re-rendering unless the state or its age label moved
+            if _view_key(state) != shown:
+                shown = _view_key(state)
+                live.update(render_dashboard(state))
+
+
 def main():
     """Main entry point for orchestra-status command."""
     parser = argparse.ArgumentParser(description="Show orchestration status")
     parser.add_argument(
         "-w", "--watch",
         action="store_true",
-        help="Watch mode - refresh every 2 seconds"
+        help="Watch mode - refresh when the state file changes"
     )
     args = parser.parse_args()
 
@@ -142,10 +207,7 @@ def main():
 
     if args.watch:
         try:
-            with Live(render_dashboard(load_state()), console=console, refresh_per_second=1) as live:
-                while True:
-                    time.sleep(REFRESH_INTERVAL)
-                    live.update(render_dashboard(load_state()))
+            run(_watch(console))
         except KeyboardInterrupt:
             pass
     else:
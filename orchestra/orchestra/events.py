@@ -0,0 +1,98 @@
+"""Append-only state event log, shared by the state manager and the dashboard.
+
+Each line of events.jsonl is one JSON event recording a change made since
+the last state.json snapshot. Replaying the events over the snapshot, in
+order, yields the current state. Replaying events the snapshot already
+contains is harmless: upserts and plain assignments are idempotent, and a
+context append records the length of the value it extended ("at"), so it
+is skipped once the value has moved past that length. Messages the
+snapshot moved to the archive are listed in its last_archived_ids, and
+upserts of them are skipped rather than bringing them back.
+"""
+
+from pathlib import Path
+from typing import Iterable
+
+import orjson
+
+EVENTS_FILE = "events.jsonl"
+
+# Model collections that "upsert" events target, and the field keying each
+_KEYS = {
+    "messages": "id",
+    "tasks": "id",
+    "reviews": "id",
+    "active_votes": "topic",
+}
+
+
+def file_key(path: Path) -> tuple[int, int, int] | None:
+    """(inode, mtime, size) of a file, or None if it is missing.
+
+    A snapshot replaces state.json and an append grows events.jsonl, so
+    comparing keys tells whether either changed since they were read.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def apply_events(data: dict, lines: Iterable[bytes]) -> int:
+    """Replay encoded event lines onto a snapshot dict in place.
+
+    Returns the number of events applied. Lines that do not parse (a blank
+    line, or a torn last line from an interrupted append) are skipped.
+    """
+    indexes: dict[str, dict[str, int]] = {}
+
+    def index(kind: str) -> dict[str, int]:
+        positions = indexes.get(kind)
+        if positions is None:
+            key = _KEYS[kind]
+            positions = indexes[kind] = {
+                item[key]: i for i, item in enumerate(data.setdefault(kind, []))
+            }
+        return positions
+
+    archived = set(data.get("last_archived_ids", ()))
+
+    applied = 0
+    for line in lines:
+        try:
+            event = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+
+        op = event["op"]
+        if op == "upsert":
+            kind, item = event["kind"], event["item"]
+            key = item[_KEYS[kind]]
+            if kind != "messages" or key not in archived:
+                positions = index(kind)
+                pos = positions.get(key)
+                if pos is None:
+                    positions[key] = len(data[kind])
+                    data[kind].append(item)
+                else:
+                    data[kind][pos] = item
+        elif op == "read":
+            pos = index("messages").get(event["id"])
+            if pos is not None:
+                data["messages"][pos]["read"] = True
+        elif op == "context":
+            data.setdefault("context", {})[event["key"]] = event["value"]
+        elif op == "append":
+            context = data.setdefault("context", {})
+            existing = context.get(event["key"]) or ""
+            at = event.get("at")
+            if at is None or len(existing) == at:
+                value = event["value"]
+                context[event["key"]] = existing + "\n" + value if existing else value
+        elif op == "set":
+            data.update(event["fields"])
+        else:
+            continue
+        applied += 1
+    return applied
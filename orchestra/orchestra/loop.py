@@ -0,0 +1,23 @@
+"""Event loop selection for Orchestra entry points."""
+
+import asyncio
+import sys
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # optional extra, not available on Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.run(main)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+    uvloop.install()
+    return asyncio.run(main)
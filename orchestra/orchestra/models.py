@@ -1,12 +1,33 @@
 """Data models for Orchestra multi-agent communication."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from time import monotonic_ns
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import uuid
 
 
+# Timestamps taken within this many nanoseconds of each other are shared
+_NOW_TTL_NS = 1_000_000
+_now_cache: tuple[int, Optional[datetime]] = (0, None)
+
+
+def utcnow() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow().
+
+    Models created in a burst (e.g. a batch of tasks) reuse the stamp from
+    the last millisecond instead of building a new datetime each time.
+    """
+    global _now_cache
+    tick = monotonic_ns()
+    last_tick, last_now = _now_cache
+    if last_now is None or tick - last_tick >= _NOW_TTL_NS:
+        last_now = datetime.now(timezone.utc)
+        _now_cache = (tick, last_now)
+    return last_now
+
+
 class AgentRole(str, Enum):
     CLAUDE = "claude"
     GEMINI = "gemini"
@@ -41,8 +62,10 @@ class MessageType(str, Enum):
 
 
 class Message(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     from_agent: AgentRole
     to_agent: Optional[AgentRole] = None  # None = broadcast
     message_type: MessageType
@@ -53,9 +76,11 @@ class Message(BaseModel):
 
 
 class Task(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     title: str
     description: str
     status: TaskStatus = TaskStatus.PENDING
@@ -68,8 +93,10 @@ class Task(BaseModel):
 
 
 class ReviewRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     from_agent: AgentRole
     to_agent: AgentRole
     task_id: Optional[str] = None
@@ -80,6 +107,8 @@ class ReviewRequest(BaseModel):
 
 
 class Vote(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     topic: str
     options: list[str]
     votes: dict[str, str] = Field(default_factory=dict)  # agent -> choice
@@ -89,10 +118,15 @@ class Vote(BaseModel):
 
 class ConversationState(BaseModel):
     """Full state of the multi-agent conversation."""
+    model_config = ConfigDict(extra="forbid")
+
     session_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=utcnow)
     initial_prompt: Optional[str] = None
-    messages: list[Message] = Field(default_factory=list)
+    messages: list[Message] = Field(default_factory=list)  # Most recent only
+    archived_message_count: int = 0  # Older messages, in archived_messages.jsonl
+    # Messages the latest snapshot archived; replaying older events skips them
+    last_archived_ids: list[str] = Field(default_factory=list)
     tasks: list[Task] = Field(default_factory=list)
     reviews: list[ReviewRequest] = Field(default_factory=list)
     context: dict[str, str] = Field(default_factory=dict)
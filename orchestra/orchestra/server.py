@@ -1,105 +1,158 @@
 """Orchestra MCP Server - Multi-Agent Autonomous Communication."""
 
-import asyncio
-import json
-import os
-from typing import Any
+from collections import deque
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Optional
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
-
-from .models import AgentRole, MessageType, Priority, TaskStatus
+from pydantic import TypeAdapter
+
+from . import loop
+from .config import EnvConfig
+from .models import (
+    AgentRole,
+    Message,
+    MessageType,
+    Priority,
+    ReviewRequest,
+    Task,
+    TaskStatus,
+)
 from .state import StateManager
 
 # Initialize
+_CFG = EnvConfig.from_env()
 server = Server("orchestra")
-state_manager = StateManager(
-    state_dir=os.environ.get("ORCHESTRA_STATE_DIR", ".orchestra")
-)
+# Responses are compact unless ORCHESTRA_PRETTY is set (for debugging)
+_JSON_OPTION = orjson.OPT_INDENT_2 if _CFG.pretty else 0
+state_manager = StateManager(state_dir=_CFG.state_dir)
+
+
+class _EnumLookup(dict):
+    """Value -> member table for parsing tool arguments without Enum(value).
+
+    Unknown values raise the same ValueError that Enum(value) would.
+    """
+
+    def __init__(self, enum: type[Enum]):
+        super().__init__((member.value, member) for member in enum)
+        self._enum_name = enum.__name__
+
+    def __missing__(self, key):
+        raise ValueError(f"{key!r} is not a valid {self._enum_name}")
+
+
+_AGENT_BY_NAME = _EnumLookup(AgentRole)
+_MSG_BY_NAME = _EnumLookup(MessageType)
+_PRIO_BY_NAME = _EnumLookup(Priority)
+_STATUS_BY_NAME = _EnumLookup(TaskStatus)
 
-# Track which agent is calling (set via environment or inferred)
-def get_current_agent() -> AgentRole:
-    """Determine which agent is making the call."""
-    agent = os.environ.get("ORCHESTRA_AGENT", "claude")
-    return AgentRole(agent.lower())
+# send_message recipients: an agent, or None for a broadcast
+_RECIPIENT_BY_NAME = _EnumLookup(AgentRole)
+_RECIPIENT_BY_NAME["broadcast"] = None
+_DEFAULT_MESSAGE_TYPE = MessageType.RESPONSE
+_DEFAULT_PRIORITY = Priority.NORMAL
+
+# Model lists are encoded straight to JSON by pydantic and embedded in the
+# response as orjson fragments, skipping the intermediate model_dump() dicts
+_MESSAGE_LIST = TypeAdapter(list[Message])
+_TASK_LIST = TypeAdapter(list[Task])
+_REVIEW_LIST = TypeAdapter(list[ReviewRequest])
+
+
+# Which agent is calling; each agent runs its own server process, so this is
+# fixed for the process lifetime (the processes share the state directory)
+_CURRENT_AGENT = _AGENT_BY_NAME[_CFG.agent]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tool Definitions
 # ─────────────────────────────────────────────────────────────────────────────
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available Orchestra tools."""
-    return [
-        # Communication
-        Tool(
-            name="orchestra_send_message",
-            description="Send a message to another agent. Use to_agent='broadcast' to send to all.",
-            inputSchema={
+# Input schemas are shared, read-only constants. Only the top level is a
+# MappingProxyType: pydantic copies it into the Tool, but cannot serialize
+# proxies nested inside the schema.
+_SCHEMA_SEND_MESSAGE = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "to_agent": {
+            "type": "string",
+            "enum": ["claude", "gemini", "codex", "copilot", "broadcast"],
+            "description": "Target agent or 'broadcast' for all"
+        },
+        "content": {"type": "string", "description": "Message content"},
+        "priority": {
+            "type": "string",
+            "enum": ["low", "normal", "high", "urgent"],
+            "default": "normal"
+        },
+        "message_type": {
+            "type": "string",
+            "enum": ["task", "question", "response", "review_request"],
+            "default": "response"
+        },
+        "in_reply_to": {
+            "type": "string",
+            "description": "Message ID this is replying to (optional)"
+        }
+    },
+    "required": ["to_agent", "content"]
+})
+_SCHEMA_GET_INBOX = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "unread_only": {
+            "type": "boolean",
+            "default": True,
+            "description": "Only return unread messages"
+        }
+    }
+})
+_SCHEMA_GET_CONVERSATION = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "limit": {
+            "type": "integer",
+            "default": 50,
+            "description": "Maximum messages to return"
+        }
+    }
+})
+_SCHEMA_CREATE_TASK = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "description": "Short task title"},
+        "description": {"type": "string", "description": "Detailed task description"},
+        "assigned_to": {
+            "type": "string",
+            "enum": ["claude", "gemini", "codex", "copilot"],
+            "description": "Agent to assign (optional)"
+        },
+        "dependencies": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Task IDs that must complete first"
+        }
+    },
+    "required": ["title", "description"]
+})
+_SCHEMA_CREATE_TASK_BATCH = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "tasks": {
+            "type": "array",
+            "items": {
                 "type": "object",
                 "properties": {
-                    "to_agent": {
-                        "type": "string",
-                        "enum": ["claude", "gemini", "codex", "copilot", "broadcast"],
-                        "description": "Target agent or 'broadcast' for all"
-                    },
-                    "content": {"type": "string", "description": "Message content"},
-                    "priority": {
-                        "type": "string",
-                        "enum": ["low", "normal", "high", "urgent"],
-                        "default": "normal"
-                    },
-                    "message_type": {
+                    "ref": {
                         "type": "string",
-                        "enum": ["task", "question", "response", "review_request"],
-                        "default": "response"
+                        "description": "Name other tasks in this batch use to depend on it (optional)"
                     },
-                    "in_reply_to": {
-                        "type": "string",
-                        "description": "Message ID this is replying to (optional)"
-                    }
-                },
-                "required": ["to_agent", "content"]
-            }
-        ),
-        Tool(
-            name="orchestra_get_inbox",
-            description="Get messages in your inbox. Returns unread messages by default.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "unread_only": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Only return unread messages"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="orchestra_get_conversation",
-            description="Get the full conversation history between all agents.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "default": 50,
-                        "description": "Maximum messages to return"
-                    }
-                }
-            }
-        ),
-
-        # Task Management
-        Tool(
-            name="orchestra_create_task",
-            description="Create a new task and optionally assign it to an agent.",
-            inputSchema={
-                "type": "object",
-                "properties": {
                     "title": {"type": "string", "description": "Short task title"},
                     "description": {"type": "string", "description": "Detailed task description"},
                     "assigned_to": {
@@ -110,368 +163,613 @@ async def list_tools() -> list[Tool]:
                     "dependencies": {
                         "type": "array",
                         "items": {"type": "string"},
-                        "description": "Task IDs that must complete first"
+                        "description": "Refs from this batch or existing task IDs that must complete first"
                     }
                 },
                 "required": ["title", "description"]
             }
-        ),
-        Tool(
-            name="orchestra_claim_task",
-            description="Claim an available task to work on. Prevents others from working on it.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID to claim"}
-                },
-                "required": ["task_id"]
-            }
-        ),
-        Tool(
-            name="orchestra_complete_task",
-            description="Mark a claimed task as complete with results.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID to complete"},
-                    "result": {"type": "string", "description": "Result/output of the task"},
-                    "files_modified": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of files modified"
-                    }
-                },
-                "required": ["task_id", "result"]
-            }
-        ),
-        Tool(
-            name="orchestra_get_tasks",
-            description="Get tasks, optionally filtered by status.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "status": {
-                        "type": "string",
-                        "enum": ["pending", "claimed", "in_progress", "review", "completed", "blocked"],
-                        "description": "Filter by status (optional)"
-                    }
-                }
-            }
-        ),
+        }
+    },
+    "required": ["tasks"]
+})
+_SCHEMA_CLAIM_TASK = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "task_id": {"type": "string", "description": "Task ID to claim"}
+    },
+    "required": ["task_id"]
+})
+_SCHEMA_COMPLETE_TASK = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "task_id": {"type": "string", "description": "Task ID to complete"},
+        "result": {"type": "string", "description": "Result/output of the task"},
+        "files_modified": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of files modified"
+        }
+    },
+    "required": ["task_id", "result"]
+})
+_SCHEMA_GET_TASKS = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "status": {
+            "type": "string",
+            "enum": ["pending", "claimed", "in_progress", "review", "completed", "blocked"],
+            "description": "Filter by status (optional)"
+        }
+    }
+})
+_SCHEMA_REQUEST_REVIEW = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "to_agent": {
+            "type": "string",
+            "enum": ["claude", "gemini", "codex", "copilot"],
+            "description": "Agent to review"
+        },
+        "content": {"type": "string", "description": "What to review (code, changes, etc.)"},
+        "task_id": {"type": "string", "description": "Related task ID (optional)"},
+        "files": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Files to review"
+        }
+    },
+    "required": ["to_agent", "content"]
+})
+_SCHEMA_SUBMIT_REVIEW = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "review_id": {"type": "string", "description": "Review request ID"},
+        "verdict": {
+            "type": "string",
+            "enum": ["APPROVED", "NEEDS_CHANGES", "REJECTED"],
+            "description": "Review verdict"
+        },
+        "feedback": {"type": "string", "description": "Detailed feedback"}
+    },
+    "required": ["review_id", "verdict", "feedback"]
+})
+_SCHEMA_EMPTY = MappingProxyType({"type": "object", "properties": {}})
+_SCHEMA_SET_CONTEXT = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "key": {"type": "string", "description": "Context key"},
+        "value": {"type": "string", "description": "Context value"}
+    },
+    "required": ["key", "value"]
+})
+_SCHEMA_GET_CONTEXT = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "key": {"type": "string", "description": "Context key (optional)"}
+    }
+})
+_SCHEMA_APPEND_CONTEXT = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "key": {"type": "string", "description": "Context key"},
+        "value": {"type": "string", "description": "Value to append"}
+    },
+    "required": ["key", "value"]
+})
+_SCHEMA_START_SESSION = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "prompt": {"type": "string", "description": "Initial user prompt/task"}
+    },
+    "required": ["prompt"]
+})
+_SCHEMA_ESCALATE = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "reason": {"type": "string", "description": "Why human intervention is needed"}
+    },
+    "required": ["reason"]
+})
+_SCHEMA_VOTE = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "topic": {"type": "string", "description": "Vote topic"},
+        "choice": {"type": "string", "description": "Your vote choice"}
+    },
+    "required": ["topic", "choice"]
+})
+_SCHEMA_CREATE_VOTE = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "topic": {"type": "string", "description": "What to vote on"},
+        "options": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Vote options"
+        }
+    },
+    "required": ["topic", "options"]
+})
+
+# Built once at import; the tool list never changes at runtime
+_TOOLS: list[Tool] = [
+    # Communication
+    Tool(
+        name="orchestra_send_message",
+        description="Send a message to another agent. Use to_agent='broadcast' to send to all.",
+        inputSchema=_SCHEMA_SEND_MESSAGE
+    ),
+    Tool(
+        name="orchestra_get_inbox",
+        description="Get messages in your inbox. Returns unread messages by default.",
+        inputSchema=_SCHEMA_GET_INBOX
+    ),
+    Tool(
+        name="orchestra_get_conversation",
+        description="Get the full conversation history between all agents.",
+        inputSchema=_SCHEMA_GET_CONVERSATION
+    ),
+
+    # Task Management
+    Tool(
+        name="orchestra_create_task",
+        description="Create a new task and optionally assign it to an agent.",
+        inputSchema=_SCHEMA_CREATE_TASK
+    ),
+    Tool(
+        name="orchestra_create_task_batch",
+        description="Create several tasks at once; dependencies may name other tasks in the batch by ref.",
+        inputSchema=_SCHEMA_CREATE_TASK_BATCH
+    ),
+    Tool(
+        name="orchestra_claim_task",
+        description="Claim an available task to work on. Prevents others from working on it.",
+        inputSchema=_SCHEMA_CLAIM_TASK
+    ),
+    Tool(
+        name="orchestra_complete_task",
+        description="Mark a claimed task as complete with results.",
+        inputSchema=_SCHEMA_COMPLETE_TASK
+    ),
+    Tool(
+        name="orchestra_get_tasks",
+        description="Get tasks, optionally filtered by status.",
+        inputSchema=_SCHEMA_GET_TASKS
+    ),
+
+    # Code Review
+    Tool(
+        name="orchestra_request_review",
+        description="Request a code review from another agent.",
+        inputSchema=_SCHEMA_REQUEST_REVIEW
+    ),
+    Tool(
+        name="orchestra_submit_review",
+        description="Submit a code review verdict.",
+        inputSchema=_SCHEMA_SUBMIT_REVIEW
+    ),
+    Tool(
+        name="orchestra_get_pending_reviews",
+        description="Get reviews waiting for you to complete.",
+        inputSchema=_SCHEMA_EMPTY
+    ),
+
+    # Shared Context
+    Tool(
+        name="orchestra_set_context",
+        description="Store shared context that all agents can access.",
+        inputSchema=_SCHEMA_SET_CONTEXT
+    ),
+    Tool(
+        name="orchestra_get_context",
+        description="Retrieve shared context by key, or all context if no key provided.",
+        inputSchema=_SCHEMA_GET_CONTEXT
+    ),
+    Tool(
+        name="orchestra_append_context",
+        description="Append to existing shared context.",
+        inputSchema=_SCHEMA_APPEND_CONTEXT
+    ),
+
+    # Orchestration
+    Tool(
+        name="orchestra_start_session",
+        description="Start a new orchestration session with an initial prompt.",
+        inputSchema=_SCHEMA_START_SESSION
+    ),
+    Tool(
+        name="orchestra_get_status",
+        description="Get the current status of the orchestration session.",
+        inputSchema=_SCHEMA_EMPTY
+    ),
+    Tool(
+        name="orchestra_escalate",
+        description="Request human intervention when stuck or need clarification.",
+        inputSchema=_SCHEMA_ESCALATE
+    ),
+    Tool(
+        name="orchestra_vote",
+        description="Cast a vote on a topic.",
+        inputSchema=_SCHEMA_VOTE
+    ),
+    Tool(
+        name="orchestra_create_vote",
+        description="Create a new vote for agents to participate in.",
+        inputSchema=_SCHEMA_CREATE_VOTE
+    ),
+    Tool(
+        name="orchestra_reset",
+        description="Reset the session and start fresh. Use with caution.",
+        inputSchema=_SCHEMA_EMPTY
+    ),
+]
 
-        # Code Review
-        Tool(
-            name="orchestra_request_review",
-            description="Request a code review from another agent.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "to_agent": {
-                        "type": "string",
-                        "enum": ["claude", "gemini", "codex", "copilot"],
-                        "description": "Agent to review"
-                    },
-                    "content": {"type": "string", "description": "What to review (code, changes, etc.)"},
-                    "task_id": {"type": "string", "description": "Related task ID (optional)"},
-                    "files": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Files to review"
-                    }
-                },
-                "required": ["to_agent", "content"]
-            }
-        ),
-        Tool(
-            name="orchestra_submit_review",
-            description="Submit a code review verdict.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "review_id": {"type": "string", "description": "Review request ID"},
-                    "verdict": {
-                        "type": "string",
-                        "enum": ["APPROVED", "NEEDS_CHANGES", "REJECTED"],
-                        "description": "Review verdict"
-                    },
-                    "feedback": {"type": "string", "description": "Detailed feedback"}
-                },
-                "required": ["review_id", "verdict", "feedback"]
-            }
-        ),
-        Tool(
-            name="orchestra_get_pending_reviews",
-            description="Get reviews waiting for you to complete.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-
-        # Shared Context
-        Tool(
-            name="orchestra_set_context",
-            description="Store shared context that all agents can access.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Context key"},
-                    "value": {"type": "string", "description": "Context value"}
-                },
-                "required": ["key", "value"]
-            }
-        ),
-        Tool(
-            name="orchestra_get_context",
-            description="Retrieve shared context by key, or all context if no key provided.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Context key (optional)"}
-                }
-            }
-        ),
-        Tool(
-            name="orchestra_append_context",
-            description="Append to existing shared context.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Context key"},
-                    "value": {"type": "string", "description": "Value to append"}
-                },
-                "required": ["key", "value"]
-            }
-        ),
 
-        # Orchestration
-        Tool(
-            name="orchestra_start_session",
-            description="Start a new orchestration session with an initial prompt.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "prompt": {"type": "string", "description": "Initial user prompt/task"}
-                },
-                "required": ["prompt"]
-            }
-        ),
-        Tool(
-            name="orchestra_get_status",
-            description="Get the current status of the orchestration session.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="orchestra_escalate",
-            description="Request human intervention when stuck or need clarification.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "reason": {"type": "string", "description": "Why human intervention is needed"}
-                },
-                "required": ["reason"]
-            }
-        ),
-        Tool(
-            name="orchestra_vote",
-            description="Cast a vote on a topic.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {"type": "string", "description": "Vote topic"},
-                    "choice": {"type": "string", "description": "Your vote choice"}
-                },
-                "required": ["topic", "choice"]
-            }
-        ),
-        Tool(
-            name="orchestra_create_vote",
-            description="Create a new vote for agents to participate in.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {"type": "string", "description": "What to vote on"},
-                    "options": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Vote options"
-                    }
-                },
-                "required": ["topic", "options"]
-            }
-        ),
-        Tool(
-            name="orchestra_reset",
-            description="Reset the session and start fresh. Use with caution.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-    ]
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available Orchestra tools."""
+    return _TOOLS
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tool Handlers
 # ─────────────────────────────────────────────────────────────────────────────
 
-@server.call_tool()
+# Arguments are checked against each tool's inputSchema before they reach a
+# handler; StateManager relies on this to skip model validation
+@server.call_tool(validate_input=True)
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls."""
-    await state_manager.initialize()
-    agent = get_current_agent()
+    """Handle tool calls, dispatching straight to the tool's handler."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _error_response(f"Unknown tool: {name}")
 
     try:
-        result = await _handle_tool(name, arguments, agent)
-        return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+        if name in _WRITE_TOOLS:
+            async with state_manager.transaction():
+                result = await handler(arguments, _CURRENT_AGENT)
+        else:
+            await state_manager.refresh()
+            result = await handler(arguments, _CURRENT_AGENT)
+        if isinstance(result, _RawJSON):
+            return _text_response(result)
+        return _text_response(orjson.dumps(result, default=str, option=_JSON_OPTION))
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
-
-
-async def _handle_tool(name: str, args: dict[str, Any], agent: AgentRole) -> dict:
-    """Route tool calls to handlers."""
-
-    # ─── Communication ───
-    if name == "orchestra_send_message":
-        to = args["to_agent"]
-        to_agent = None if to == "broadcast" else AgentRole(to)
-        msg = await state_manager.send_message(
-            from_agent=agent,
-            to_agent=to_agent,
-            content=args["content"],
-            message_type=MessageType(args.get("message_type", "response")),
-            priority=Priority(args.get("priority", "normal")),
-            in_reply_to=args.get("in_reply_to"),
-        )
-        return {"success": True, "message_id": msg.id}
+        return _error_response(str(e))
 
-    elif name == "orchestra_get_inbox":
-        messages = await state_manager.get_inbox(
-            agent=agent,
-            unread_only=args.get("unread_only", True)
-        )
-        return {
-            "agent": agent.value,
-            "message_count": len(messages),
-            "messages": [m.model_dump() for m in messages]
-        }
 
-    elif name == "orchestra_get_conversation":
-        messages = await state_manager.get_conversation(limit=args.get("limit", 50))
-        return {
-            "message_count": len(messages),
-            "messages": [m.model_dump() for m in messages]
-        }
+def _text_response(payload: bytes) -> list[TextContent]:
+    """Wrap an encoded JSON payload as a tool result."""
+    return [TextContent(type="text", text=payload.decode())]
 
-    # ─── Task Management ───
-    elif name == "orchestra_create_task":
-        assigned = AgentRole(args["assigned_to"]) if args.get("assigned_to") else None
+
+class _RawJSON(bytes):
+    """A handler result that is already encoded JSON and is sent as-is."""
+
+
+# Fixed replies, encoded once
+_ESCALATED = _RawJSON(orjson.dumps({"success": True, "message": "Human intervention requested"}))
+_RESET = _RawJSON(orjson.dumps({"success": True, "message": "Session reset"}))
+
+# Idle agents mostly get empty listings back
+_EMPTY_INBOX = {
+    role: _RawJSON(orjson.dumps({"agent": role.value, "message_count": 0, "messages": []}))
+    for role in AgentRole
+}
+_EMPTY_CONVERSATION = _RawJSON(orjson.dumps({"message_count": 0, "messages": []}))
+_NO_TASKS = _RawJSON(orjson.dumps({"task_count": 0, "tasks": []}))
+_NO_PENDING_REVIEWS = _RawJSON(orjson.dumps({"pending_count": 0, "reviews": []}))
+
+
+def _success_with(field: bytes, value: str) -> _RawJSON:
+    """Encode {"success": true, <field>: value} without building a dict."""
+    return _RawJSON(b'{"success":true,"' + field + b'":' + orjson.dumps(value) + b"}")
+
+
+@lru_cache(maxsize=256)
+def _error_response(message: str) -> list[TextContent]:
+    """Build an error result once per distinct message (callers must not mutate it)."""
+    return _text_response(orjson.dumps({"error": message}))
+
+
+# ─── Communication ───
+
+async def _h_send_message(args: dict[str, Any], agent: AgentRole) -> _RawJSON:
+    to = args["to_agent"]
+    content = args["content"]
+    message_type = args.get("message_type")
+    priority = args.get("priority")
+    in_reply_to = args.get("in_reply_to")
+
+    msg = await state_manager.send_message(
+        agent,
+        _RECIPIENT_BY_NAME[to],
+        content,
+        _DEFAULT_MESSAGE_TYPE if message_type is None else _MSG_BY_NAME[message_type],
+        _DEFAULT_PRIORITY if priority is None else _PRIO_BY_NAME[priority],
+        in_reply_to,
+    )
+    return _success_with(b"message_id", msg.id)
+
+
+async def _h_get_inbox(args: dict[str, Any], agent: AgentRole) -> dict | _RawJSON:
+    unread_only = args.get("unread_only", True)
+    messages = await state_manager.get_inbox(agent, unread_only)
+    if not messages:
+        return _EMPTY_INBOX[agent]
+    return {
+        "agent": agent.value,
+        "message_count": len(messages),
+        "messages": orjson.Fragment(_MESSAGE_LIST.dump_json(messages))
+    }
+
+
+async def _h_get_conversation(args: dict[str, Any], agent: AgentRole) -> dict | _RawJSON:
+    limit = args.get("limit", 50)
+    messages = await state_manager.get_conversation(limit)
+    if not messages:
+        return _EMPTY_CONVERSATION
+    return {
+        "message_count": len(messages),
+        "messages": orjson.Fragment(_MESSAGE_LIST.dump_json(messages))
+    }
+
+
+# ─── Task Management ───
+
+async def _h_create_task(args: dict[str, Any], agent: AgentRole) -> dict:
+    title = args["title"]
+    description = args["description"]
+    assigned_to = args.get("assigned_to")
+    dependencies = args.get("dependencies")
+
+    assigned = _AGENT_BY_NAME[assigned_to] if assigned_to else None
+    task = await state_manager.create_task(title, description, agent, assigned, dependencies)
+    return {"success": True, "task_id": task.id, "task": orjson.Fragment(task.model_dump_json())}
+
+
+async def _h_create_task_batch(args: dict[str, Any], agent: AgentRole) -> dict:
+    specs = args["tasks"]
+    refs = {}
+    for i, spec in enumerate(specs):
+        ref = spec.get("ref")
+        if ref is not None:
+            if ref in refs:
+                return {"success": False, "error": f"Duplicate ref in batch: {ref}"}
+            refs[ref] = i
+
+    # Kahn's algorithm over the in-batch edges: a task is created only after
+    # the tasks it depends on, so every ref resolves to a real ID
+    in_degree = [0] * len(specs)
+    dependents: list[list[int]] = [[] for _ in specs]
+    spec_deps = [spec.get("dependencies") or () for spec in specs]
+    for i, deps in enumerate(spec_deps):
+        for dep in deps:
+            if dep in refs:
+                in_degree[i] += 1
+                dependents[refs[dep]].append(i)
+    queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+    order = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for j in dependents[i]:
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                queue.append(j)
+    if len(order) < len(specs):
+        cyclic = [specs[i].get("ref", str(i)) for i, degree in enumerate(in_degree) if degree]
+        return {"success": False, "error": f"Dependency cycle among batch tasks: {', '.join(cyclic)}"}
+
+    ids: list[Optional[str]] = [None] * len(specs)
+    ready = []
+    for i in order:
+        spec = specs[i]
+        assigned_to = spec.get("assigned_to")
+        dependencies = [ids[refs[dep]] if dep in refs else dep for dep in spec_deps[i]]
         task = await state_manager.create_task(
-            title=args["title"],
-            description=args["description"],
-            created_by=agent,
-            assigned_to=assigned,
-            dependencies=args.get("dependencies"),
+            spec["title"],
+            spec["description"],
+            agent,
+            _AGENT_BY_NAME[assigned_to] if assigned_to else None,
+            dependencies,
         )
-        return {"success": True, "task_id": task.id, "task": task.model_dump()}
-
-    elif name == "orchestra_claim_task":
-        task = await state_manager.claim_task(args["task_id"], agent)
-        if task:
-            return {"success": True, "task": task.model_dump()}
-        return {"success": False, "error": "Could not claim task (already claimed or dependencies not met)"}
-
-    elif name == "orchestra_complete_task":
-        task = await state_manager.complete_task(
-            task_id=args["task_id"],
-            agent=agent,
-            result=args["result"],
-            files_modified=args.get("files_modified"),
-        )
-        if task:
-            return {"success": True, "task": task.model_dump()}
-        return {"success": False, "error": "Could not complete task (not claimed by you)"}
-
-    elif name == "orchestra_get_tasks":
-        status = TaskStatus(args["status"]) if args.get("status") else None
-        tasks = await state_manager.get_tasks(status=status)
-        return {
-            "task_count": len(tasks),
-            "tasks": [t.model_dump() for t in tasks]
-        }
+        ids[i] = task.id
+        # Claimable right away if nothing it waits on is still open
+        for dep_id in dependencies:
+            dep_task = await state_manager.get_task(dep_id)
+            if dep_task and dep_task.status != TaskStatus.COMPLETED:
+                break
+        else:
+            ready.append(task.id)
 
-    # ─── Code Review ───
-    elif name == "orchestra_request_review":
-        review = await state_manager.request_review(
-            from_agent=agent,
-            to_agent=AgentRole(args["to_agent"]),
-            content=args["content"],
-            task_id=args.get("task_id"),
-            files=args.get("files"),
-        )
-        return {"success": True, "review_id": review.id}
-
-    elif name == "orchestra_submit_review":
-        review = await state_manager.submit_review(
-            review_id=args["review_id"],
-            agent=agent,
-            verdict=args["verdict"],
-            feedback=args["feedback"],
-        )
-        if review:
-            return {"success": True, "review": review.model_dump()}
-        return {"success": False, "error": "Review not found or not assigned to you"}
-
-    elif name == "orchestra_get_pending_reviews":
-        reviews = await state_manager.get_pending_reviews(agent)
-        return {
-            "pending_count": len(reviews),
-            "reviews": [r.model_dump() for r in reviews]
-        }
+    return {
+        "success": True,
+        "task_ids": [ids[i] for i in order],
+        "refs": {ref: ids[i] for ref, i in refs.items()},
+        "ready": ready,
+    }
 
-    # ─── Shared Context ───
-    elif name == "orchestra_set_context":
-        await state_manager.set_context(args["key"], args["value"])
-        return {"success": True, "key": args["key"]}
 
-    elif name == "orchestra_get_context":
-        if args.get("key"):
-            value = await state_manager.get_context(args["key"])
-            return {"key": args["key"], "value": value}
-        else:
-            context = await state_manager.get_all_context()
-            return {"context": context}
-
-    elif name == "orchestra_append_context":
-        await state_manager.append_context(args["key"], args["value"])
-        return {"success": True, "key": args["key"]}
-
-    # ─── Orchestration ───
-    elif name == "orchestra_start_session":
-        await state_manager.set_initial_prompt(args["prompt"])
-        return {
-            "success": True,
-            "session_id": state_manager.state.session_id,
-            "message": "Session started. Create tasks and assign to agents."
-        }
+async def _h_claim_task(args: dict[str, Any], agent: AgentRole) -> dict:
+    task_id = args["task_id"]
+    task = await state_manager.claim_task(task_id, agent)
+    if task:
+        return {"success": True, "task": orjson.Fragment(task.model_dump_json())}
+    return {"success": False, "error": "Could not claim task (already claimed or dependencies not met)"}
 
-    elif name == "orchestra_get_status":
-        return await state_manager.get_status()
 
-    elif name == "orchestra_escalate":
-        await state_manager.escalate_to_human(agent, args["reason"])
-        return {"success": True, "message": "Human intervention requested"}
+async def _h_complete_task(args: dict[str, Any], agent: AgentRole) -> dict:
+    task_id = args["task_id"]
+    result = args["result"]
+    files_modified = args.get("files_modified")
 
-    elif name == "orchestra_vote":
-        vote = await state_manager.cast_vote(args["topic"], agent, args["choice"])
-        if vote:
-            return {"success": True, "votes_cast": len(vote.votes)}
-        return {"success": False, "error": "Vote not found or invalid choice"}
+    task = await state_manager.complete_task(task_id, agent, result, files_modified)
+    if task:
+        return {"success": True, "task": orjson.Fragment(task.model_dump_json())}
+    return {"success": False, "error": "Could not complete task (not claimed by you)"}
 
-    elif name == "orchestra_create_vote":
-        vote = await state_manager.create_vote(args["topic"], args["options"])
-        return {"success": True, "topic": vote.topic, "options": vote.options}
 
-    elif name == "orchestra_reset":
-        await state_manager.reset()
-        return {"success": True, "message": "Session reset"}
+async def _h_get_tasks(args: dict[str, Any], agent: AgentRole) -> dict | _RawJSON:
+    status = args.get("status")
+    tasks = await state_manager.get_tasks(_STATUS_BY_NAME[status] if status else None)
+    if not tasks:
+        return _NO_TASKS
+    return {
+        "task_count": len(tasks),
+        "tasks": orjson.Fragment(_TASK_LIST.dump_json(tasks))
+    }
+
+
+# ─── Code Review ───
+
+async def _h_request_review(args: dict[str, Any], agent: AgentRole) -> dict:
+    to_agent = args["to_agent"]
+    content = args["content"]
+    task_id = args.get("task_id")
+    files = args.get("files")
+
+    review = await state_manager.request_review(
+        agent, _AGENT_BY_NAME[to_agent], content, task_id, files
+    )
+    return {"success": True, "review_id": review.id}
+
+
+async def _h_submit_review(args: dict[str, Any], agent: AgentRole) -> dict:
+    review_id = args["review_id"]
+    verdict = args["verdict"]
+    feedback = args["feedback"]
+
+    review = await state_manager.submit_review(review_id, agent, verdict, feedback)
+    if review:
+        return {"success": True, "review": orjson.Fragment(review.model_dump_json())}
+    return {"success": False, "error": "Review not found or not assigned to you"}
+
+
+async def _h_get_pending_reviews(args: dict[str, Any], agent: AgentRole) -> dict | _RawJSON:
+    reviews = await state_manager.get_pending_reviews(agent)
+    if not reviews:
+        return _NO_PENDING_REVIEWS
+    return {
+        "pending_count": len(reviews),
+        "reviews": orjson.Fragment(_REVIEW_LIST.dump_json(reviews))
+    }
+
 
+# ─── Shared Context ───
+
+async def _h_set_context(args: dict[str, Any], agent: AgentRole) -> _RawJSON:
+    key = args["key"]
+    value = args["value"]
+    await state_manager.set_context(key, value)
+    return _success_with(b"key", key)
+
+
+async def _h_get_context(args: dict[str, Any], agent: AgentRole) -> dict:
+    key = args.get("key")
+    if key:
+        value = await state_manager.get_context(key)
+        return {"key": key, "value": value}
     else:
-        return {"error": f"Unknown tool: {name}"}
+        context = await state_manager.get_all_context()
+        return {"context": context}
+
+
+async def _h_append_context(args: dict[str, Any], agent: AgentRole) -> _RawJSON:
+    key = args["key"]
+    value = args["value"]
+    await state_manager.append_context(key, value)
+    return _success_with(b"key", key)
+
+
+# ─── Orchestration ───
+
+async def _h_start_session(args: dict[str, Any], agent: AgentRole) -> dict:
+    prompt = args["prompt"]
+    await state_manager.set_initial_prompt(prompt)
+    return {
+        "success": True,
+        "session_id": state_manager.state.session_id,
+        "message": "Session started. Create tasks and assign to agents."
+    }
+
+
+async def _h_get_status(args: dict[str, Any], agent: AgentRole) -> dict:
+    return await state_manager.get_status()
+
+
+async def _h_escalate(args: dict[str, Any], agent: AgentRole) -> _RawJSON:
+    reason = args["reason"]
+    await state_manager.escalate_to_human(agent, reason)
+    return _ESCALATED
+
+
+async def _h_vote(args: dict[str, Any], agent: AgentRole) -> dict:
+    topic = args["topic"]
+    choice = args["choice"]
+    vote = await state_manager.cast_vote(topic, agent, choice)
+    if vote:
+        return {"success": True, "votes_cast": len(vote.votes)}
+    return {"success": False, "error": "Vote not found or invalid choice"}
+
+
+async def _h_create_vote(args: dict[str, Any], agent: AgentRole) -> dict:
+    topic = args["topic"]
+    options = args["options"]
+    vote = await state_manager.create_vote(topic, options)
+    if vote:
+        return {"success": True, "topic": vote.topic, "options": vote.options}
+    return {"success": False, "error": "A vote on this topic already exists"}
+
+
+async def _h_reset(args: dict[str, Any], agent: AgentRole) -> _RawJSON:
+    await state_manager.reset()
+    return _RESET
+
+
+# Tool name -> handler, so dispatch is a single dict lookup
+_HANDLERS: dict[str, Callable[[dict[str, Any], AgentRole], Awaitable[dict | _RawJSON]]] = {
+    "orchestra_send_message": _h_send_message,
+    "orchestra_get_inbox": _h_get_inbox,
+    "orchestra_get_conversation": _h_get_conversation,
+    "orchestra_create_task": _h_create_task,
+    "orchestra_create_task_batch": _h_create_task_batch,
+    "orchestra_claim_task": _h_claim_task,
+    "orchestra_complete_task": _h_complete_task,
+    "orchestra_get_tasks": _h_get_tasks,
+    "orchestra_request_review": _h_request_review,
+    "orchestra_submit_review": _h_submit_review,
+    "orchestra_get_pending_reviews": _h_get_pending_reviews,
+    "orchestra_set_context": _h_set_context,
+    "orchestra_get_context": _h_get_context,
+    "orchestra_append_context": _h_append_context,
+    "orchestra_start_session": _h_start_session,
+    "orchestra_get_status": _h_get_status,
+    "orchestra_escalate": _h_escalate,
+    "orchestra_vote": _h_vote,
+    "orchestra_create_vote": _h_create_vote,
+    "orchestra_reset": _h_reset,
+}
+
+# Tools that change state. Each runs in a StateManager transaction, so it
+# sees changes other agents' servers made and no other write, from this
+# process or another, interleaves with it.
+_WRITE_TOOLS = frozenset({
+    "orchestra_send_message",
+    "orchestra_create_task",
+    "orchestra_create_task_batch",
+    "orchestra_claim_task",
+    "orchestra_complete_task",
+    "orchestra_request_review",
+    "orchestra_submit_review",
+    "orchestra_set_context",
+    "orchestra_append_context",
+    "orchestra_start_session",
+    "orchestra_escalate",
+    "orchestra_vote",
+    "orchestra_create_vote",
+    "orchestra_reset",
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -481,10 +779,17 @@ async def _handle_tool(name: str, args: dict[str, Any], agent: AgentRole) -> dic
 def main():
     """Run the Orchestra MCP server."""
     async def run():
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(read_stream, write_stream, server.create_initialization_options())
-
-    asyncio.run(run())
+        # Other agents' servers write the same state directory; tool calls
+        # reload the state whenever it changed since this process read it
+        await state_manager.initialize()
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(read_stream, write_stream, server.create_initialization_options())
+        finally:
+            # Write out changes the background flusher has not reached yet
+            await state_manager.close()
+
+    loop.run(run())
 
 
 if __name__ == "__main__":
@@ -1,13 +1,22 @@
 """State management for Orchestra - persists conversation state to disk."""
 
-import json
+import asyncio
 import os
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from queue import Empty, SimpleQueue
 from typing import Optional
 
-import aiofiles
+import orjson
+from pydantic import BaseModel
 
+from .events import EVENTS_FILE, apply_events, file_key
 from .models import (
     AgentRole,
     ConversationState,
@@ -18,41 +27,598 @@ from .models import (
     Task,
     TaskStatus,
     Vote,
+    utcnow,
 )
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+# Compact the event log into a fresh snapshot after this many events
+SNAPSHOT_EVERY = 500
+# Seconds the background flusher waits after a change, to coalesce bursts
+FLUSH_DELAY = 0.1
+# Messages kept in the live state; older ones move to ARCHIVE_FILE when a
+# snapshot is taken
+MAX_LIVE_MESSAGES = 1000
+ARCHIVE_FILE = "archived_messages.jsonl"
+# Locked by whichever server process is writing the state directory
+LOCK_FILE = "state.lock"
+# Seconds between attempts to take a lock another process holds
+LOCK_POLL = 0.01
+
+
+def _static_defaults(model: type[BaseModel]) -> dict:
+    """Fields of a model whose default is a fixed value, with that value.
+
+    Fields filled by other factories (ids, timestamps) are left out, so a
+    snapshot always keeps them; pydantic's exclude_defaults would compare
+    them against a fresh factory call instead.
+    """
+    defaults = {}
+    for name, field in model.model_fields.items():
+        if field.default_factory in (list, dict):
+            defaults[name] = field.default_factory()
+        elif field.default_factory is None and not field.is_required():
+            defaults[name] = field.default
+    return defaults
+
+
+# Snapshot collections and the defaults their items can leave out
+_ITEM_DEFAULTS = {
+    "messages": _static_defaults(Message),
+    "tasks": _static_defaults(Task),
+    "reviews": _static_defaults(ReviewRequest),
+    "active_votes": _static_defaults(Vote),
+}
+_STATE_DEFAULTS = _static_defaults(ConversationState)
+
+
+def _strip_defaults(item: dict, defaults: dict) -> dict:
+    return {
+        k: v for k, v in item.items()
+        if k not in defaults or v != defaults[k]
+    }
+
+
+def _snapshot_dict(state: ConversationState) -> dict:
+    """Dump the state without fields still at their default, which loading
+    fills back in; most messages and tasks carry several."""
+    data = state.model_dump()
+    for kind, defaults in _ITEM_DEFAULTS.items():
+        data[kind] = [_strip_defaults(item, defaults) for item in data[kind]]
+    return _strip_defaults(data, _STATE_DEFAULTS)
+
+
+def _append_bytes(path: Path, data: bytes):
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Replace path with data so readers see the old file or the new one.
+
+    The data is written to a temp file and fsynced before the rename, and
+    the directory is fsynced after it, so a crash can't leave state.json
+    truncated or the rename unrecorded.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return  # Directories can't be opened on Windows
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _try_lock(fd: int) -> bool:
+    """Lock fd exclusively without blocking; False if another process has it."""
+    try:
+        if sys.platform == "win32":
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int):
+    if sys.platform == "win32":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class _DirLock:
+    """Exclusive lock on the state directory, across processes.
+
+    Every agent runs its own server over the same directory, so appends,
+    snapshots and read-modify-write operations all hold this lock. It is
+    re-entrant within the asyncio task that holds it. The OS lock is polled
+    rather than waited on in a thread, so a cancelled waiter never leaves
+    it taken.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+        # Orders this process's own holders; the OS lock orders processes
+        self._local = asyncio.Lock()
+        self._owner: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def hold(self):
+        task = asyncio.current_task()
+        if self._owner is task:
+            yield
+            return
+        async with self._local:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            while not _try_lock(self._fd):
+                await asyncio.sleep(LOCK_POLL)
+            self._owner = task
+            try:
+                yield
+            finally:
+                self._owner = None
+                _unlock(self._fd)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class _LogWriter:
+    """Appends conversation.md entries from a dedicated thread.
+
+    Callers enqueue encoded entries without waiting; the thread drains
+    everything queued so far and writes it with a single os.write on a
+    descriptor it keeps open.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="orchestra-log", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, data: bytes):
+        self._queue.put(data)
+
+    def rotate(self, dest: Path):
+        """Move the log to dest once the entries queued before this are
+        written; later entries start a new file."""
+        self._queue.put(dest)
+
+    async def stop(self):
+        """Write what is queued, then end the thread."""
+        self._queue.put(self._STOP)
+        await asyncio.to_thread(self._thread.join)
+
+    def _run(self):
+        fd = None
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            chunks = []
+            for item in items:
+                if isinstance(item, bytes):
+                    chunks.append(item)
+                    continue
+                fd = self._write(fd, chunks)
+                chunks = []
+                if fd is not None:
+                    os.close(fd)
+                    fd = None
+                if item is self._STOP:
+                    return
+                try:
+                    os.replace(self.path, item)
+                except FileNotFoundError:
+                    pass
+            fd = self._write(fd, chunks)
+
+    def _still_current(self, fd: int) -> bool:
+        """Whether fd is still the file at self.path.
+
+        Another process's reset() renames the log away; this writer must
+        then start the new file instead of appending to the rotated one.
+        """
+        try:
+            return os.fstat(fd).st_ino == os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return False
+
+    def _write(self, fd: Optional[int], chunks: list[bytes]) -> Optional[int]:
+        if not chunks:
+            return fd
+        try:
+            if fd is not None and not self._still_current(fd):
+                os.close(fd)
+                fd = None
+            if fd is None:
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            data = memoryview(b"".join(chunks))
+            while data:
+                data = data[os.write(fd, data):]
+        except OSError:
+            pass  # The log is for debugging only; never let it stop the thread
+        return fd
+
 
 class StateManager:
-    """Manages persistent state for multi-agent communication."""
+    """Manages persistent state for multi-agent communication.
+
+    state.json holds a full snapshot; each change after it is appended to
+    events.jsonl as one line, so a mutation writes a few hundred bytes
+    instead of the whole state. The log is folded into a new snapshot every
+    SNAPSHOT_EVERY events.
+
+    Mutations only update memory and queue their event; a background task
+    appends queued events to the log FLUSH_DELAY seconds after the first
+    change, so a burst of operations costs one write. Call close() before
+    exiting to write anything still queued.
+
+    Several processes (one server per agent) can share a state directory.
+    refresh() reloads when the files changed since this process last
+    matched them, and transaction() runs a change against the latest state
+    under a lock held across processes, appending its events before the
+    lock is released.
+
+    Arguments are trusted to match the model field types (the MCP server,
+    mcp 1.10 or later, validates tool input against its schemas), so new
+    messages, tasks, reviews and votes are built with model_construct,
+    skipping validation; state loaded from disk is still fully validated.
+    """
 
     def __init__(self, state_dir: str = ".orchestra"):
         self.state_dir = Path(state_dir)
         self.state_file = self.state_dir / "state.json"
+        self.events_file = self.state_dir / EVENTS_FILE
         self.conversation_log = self.state_dir / "conversation.md"
+        self.archive_file = self.state_dir / ARCHIVE_FILE
+        self._lock = _DirLock(self.state_dir / LOCK_FILE)
+        # file_key()s of state.json and events.jsonl when memory last held
+        # exactly what they contain; any other key means another process
+        # has written since
+        self._disk_key: Optional[tuple] = None
         self._state: Optional[ConversationState] = None
+        # Encoded events not yet appended to the log
+        self._pending_events: list[bytes] = []
+        self._events_since_snapshot = 0
+        # Nesting depth of batch() blocks
+        self._batch_depth = 0
+        # Set when events are queued; wakes the background flusher
+        self._dirty = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set by close(); the flusher exits at its next wake-up
+        self._closing = False
+        # Writes conversation.md; started with the first entry
+        self._log_writer: Optional[_LogWriter] = None
+        # Lookup indexes over the state lists, rebuilt by _index_state()
+        self._messages_by_id: dict[str, Message] = {}
+        self._tasks_by_id: dict[str, Task] = {}
+        self._reviews_by_id: dict[str, ReviewRequest] = {}
+        self._votes_by_topic: dict[str, Vote] = {}
+        # Unread messages per recipient, in arrival order (dicts keyed by id
+        # so mark_read can drop one without a scan)
+        self._unread_by_agent: dict[AgentRole, dict[str, Message]] = {}
+        # Task ids by status and by assignee, plus each task's list position
+        # so filtered results keep list order
+        self._tasks_by_status: defaultdict[TaskStatus, set[str]] = defaultdict(set)
+        self._tasks_by_assignee: defaultdict[Optional[AgentRole], set[str]] = defaultdict(set)
+        self._task_positions: dict[str, int] = {}
+        # Reviews awaiting a verdict per reviewer, in request order
+        self._pending_reviews_by_agent: dict[AgentRole, dict[str, ReviewRequest]] = {}
+        # Context values still being appended to, as chunks awaiting one
+        # "\n".join; state.context holds them once read or snapshotted
+        self._context_chunks: dict[str, list[str]] = {}
+        # Length each chunked value will have once joined
+        self._context_lengths: dict[str, int] = {}
 
     async def initialize(self) -> ConversationState:
         """Initialize or load existing state."""
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
-        if self.state_file.exists():
-            async with aiofiles.open(self.state_file, "r") as f:
-                data = json.loads(await f.read())
-                self._state = ConversationState(**data)
-        else:
-            self._state = ConversationState()
-            await self._save()
+        async with self._lock.hold():
+            if self.state_file.exists():
+                await self._load()
+            else:
+                self._state = ConversationState()
+                self._index_state()
+                await self._save()
 
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
         return self._state
 
-    async def _save(self):
-        """Persist state to disk."""
-        async with aiofiles.open(self.state_file, "w") as f:
-            await f.write(self._state.model_dump_json(indent=2))
+    def _disk_state_key(self) -> tuple:
+        return (file_key(self.state_file), file_key(self.events_file))
+
+    async def _load(self):
+        """Read the snapshot and replay the log; the caller holds the lock."""
+        raw = await asyncio.to_thread(self.state_file.read_bytes)
+        events = b""
+        if self.events_file.exists():
+            events = await asyncio.to_thread(self.events_file.read_bytes)
+        if events:
+            data = orjson.loads(raw)
+            self._events_since_snapshot = apply_events(data, events.splitlines())
+            self._state = ConversationState.model_validate(data)
+        else:
+            # Nothing to replay: let pydantic-core parse the bytes directly
+            self._events_since_snapshot = 0
+            self._state = ConversationState.model_validate_json(raw)
+        self._context_chunks.clear()
+        self._context_lengths.clear()
+        self._index_state()
+        self._disk_key = self._disk_state_key()
+
+    async def refresh(self):
+        """Pick up changes other processes made to the state directory.
+
+        Queued events are appended first, so the reload includes them. When
+        neither file changed this is two stat() calls.
+        """
+        if not self._pending_events and self._disk_state_key() == self._disk_key:
+            return
+        async with self._lock.hold():
+            await self._flush_events()
+            if self._disk_state_key() != self._disk_key:
+                await self._load()
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Run a block of changes against the latest state on disk.
+
+        The directory lock is held throughout, so no other process writes
+        in between, and the block's events are appended before it is
+        released.
+        """
+        async with self._lock.hold():
+            await self.refresh()
+            try:
+                async with self.batch():
+                    yield
+            finally:
+                await self._flush_events()
+
+    def _index_state(self):
+        """Rebuild the lookup indexes from the loaded state."""
+        state = self._state
+        self._messages_by_id = {m.id: m for m in state.messages}
+        self._tasks_by_id = {}
+        self._reviews_by_id = {r.id: r for r in state.reviews}
+        # cast_vote targets the first vote on a topic, as the scan used to
+        self._votes_by_topic = {}
+        for vote in state.active_votes:
+            self._votes_by_topic.setdefault(vote.topic, vote)
+        self._tasks_by_status = defaultdict(set)
+        self._tasks_by_assignee = defaultdict(set)
+        self._task_positions = {}
+        for task in state.tasks:
+            self._index_task(task)
+        self._pending_reviews_by_agent = {role: {} for role in AgentRole}
+        for review in state.reviews:
+            if review.verdict is None:
+                self._pending_reviews_by_agent[review.to_agent][review.id] = review
+        self._unread_by_agent = {role: {} for role in AgentRole}
+        for msg in state.messages:
+            if not msg.read:
+                for role in self._recipients(msg):
+                    self._unread_by_agent[role][msg.id] = msg
+
+    @staticmethod
+    def _recipients(msg: Message) -> tuple[AgentRole, ...]:
+        """Agents whose inbox a message lands in; never its sender."""
+        if msg.to_agent is None:
+            return tuple(role for role in AgentRole if role != msg.from_agent)
+        if msg.to_agent == msg.from_agent:
+            return ()
+        return (msg.to_agent,)
+
+    def _index_task(self, task: Task):
+        """Add a task (already appended to state.tasks) to the indexes."""
+        self._tasks_by_id[task.id] = task
+        self._tasks_by_status[task.status].add(task.id)
+        self._tasks_by_assignee[task.assigned_to].add(task.id)
+        self._task_positions[task.id] = len(self._task_positions)
+
+    def _set_task_status(self, task: Task, status: TaskStatus):
+        """Move a task to a new status, keeping the status index current."""
+        self._tasks_by_status[task.status].discard(task.id)
+        self._tasks_by_status[status].add(task.id)
+        task.status = status
+
+    async def close(self):
+        """Stop the background flusher and write anything still queued.
+
+        The flusher is asked to stop rather than cancelled, so an append it
+        has in flight always finishes and is accounted for.
+        """
+        if self._flush_task is not None:
+            self._closing = True
+            self._dirty.set()
+            await self._flush_task
+            self._flush_task = None
+            self._closing = False
+        await self._flush_events()
+        self._lock.close()
+        if self._log_writer is not None:
+            await self._log_writer.stop()
+            self._log_writer = None
+
+    @asynccontextmanager
+    async def batch(self):
+        """Hold back the background flush until the block exits.
+
+        Events from the block then reach the log in the same append, never
+        split across two.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_events:
+                self._dirty.set()
+
+    async def _flush_loop(self):
+        """Append queued events shortly after they arrive."""
+        # Once close() asks us to stop, it writes whatever is left itself
+        while not self._closing:
+            await self._dirty.wait()
+            if not self._closing:
+                await asyncio.sleep(FLUSH_DELAY)
+            self._dirty.clear()
+            if self._batch_depth:
+                continue  # batch() wakes us again on exit
+            try:
+                await self._flush_events()
+            except OSError:
+                # Events stay queued; try again after the next delay
+                self._dirty.set()
+            except Exception:
+                # Report on stderr (stdout is the MCP stream), keep flushing
+                traceback.print_exc()
+
+    def _record(self, event: dict):
+        """Queue one state change (already applied in memory) for the log.
+
+        Queuing never yields to the event loop, so an operation that records
+        several changes always reaches the log in a single flush.
+        """
+        self._pending_events.append(orjson.dumps(event) + b"\n")
+        if not self._batch_depth:
+            self._dirty.set()
+
+    def _record_upsert(self, kind: str, item: BaseModel):
+        """Log the current version of a message, task, review or vote."""
+        self._record({
+            "op": "upsert",
+            "kind": kind,
+            "item": orjson.Fragment(item.model_dump_json()),
+        })
+
+    async def _flush_events(self):
+        """Append pending events to the log, snapshotting when it grows long.
+
+        A snapshot is only taken while memory holds everything on disk, so
+        it never drops events another process appended.
+        """
+        if not self._pending_events:
+            return
+        async with self._lock.hold():
+            count = len(self._pending_events)
+            if not count:
+                return
+            current = self._disk_state_key() == self._disk_key
+            # Take the events before writing: if this task is cancelled the
+            # write still completes in its thread, so they must not stay
+            # queued for a second append
+            events = self._pending_events[:count]
+            del self._pending_events[:count]
+            try:
+                await asyncio.to_thread(_append_bytes, self.events_file, b"".join(events))
+            except OSError:
+                # Not written; requeue ahead of anything queued meanwhile
+                self._pending_events[:0] = events
+                raise
+            self._events_since_snapshot += count
+            if not current:
+                return  # The next refresh() reloads, these events included
+            self._disk_key = self._disk_state_key()
+            if self._events_since_snapshot >= SNAPSHOT_EVERY:
+                await self._write_snapshot()
 
-    async def _append_to_log(self, entry: str):
-        """Append to human-readable conversation log."""
-        async with aiofiles.open(self.conversation_log, "a") as f:
-            await f.write(entry + "\n\n")
+    async def _save(self):
+        """Write a full snapshot of the state and empty the event log."""
+        async with self._lock.hold():
+            await self._write_snapshot()
+
+    async def _write_snapshot(self):
+        """Snapshot the state; the caller holds the lock.
+
+        state.json is replaced atomically, so readers such as the dashboard
+        never see a partially written file. The log is only truncated once
+        the snapshot is durable; a crash in between just replays events the
+        snapshot already holds.
+        """
+        self._join_context()
+        self._state.last_archived_ids = []
+        overflow = len(self._state.messages) - MAX_LIVE_MESSAGES
+        if overflow > 0:
+            await self._archive_messages(overflow)
+
+        # orjson encodes the model_dump() datetimes and enums natively, which
+        # beats pydantic's own JSON writer on large states
+        # Events queued up to this point are covered by the snapshot
+        data = orjson.dumps(_snapshot_dict(self._state))
+        covered = len(self._pending_events)
+        await asyncio.to_thread(_write_atomic, self.state_file, data)
+        await asyncio.to_thread(self.events_file.write_bytes, b"")
+        del self._pending_events[:covered]
+        self._events_since_snapshot = 0
+        self._disk_key = self._disk_state_key()
+
+    async def _archive_messages(self, count: int):
+        """Move up to count of the oldest read messages into the archive.
+
+        Archived messages leave the conversation history; they are kept, one
+        JSON object per line, in archived_messages.jsonl. Messages still
+        unread by any recipient stay live so they remain in its inbox.
+        """
+        unread = set()
+        for inbox in self._unread_by_agent.values():
+            unread.update(inbox)
+        archived, live = [], []
+        for msg in self._state.messages:
+            if len(archived) < count and msg.id not in unread:
+                archived.append(msg)
+            else:
+                live.append(msg)
+        if not archived:
+            return
+        await asyncio.to_thread(
+            _append_bytes,
+            self.archive_file,
+            b"".join(m.model_dump_json().encode() + b"\n" for m in archived),
+        )
+        for msg in archived:
+            del self._messages_by_id[msg.id]
+        self._state.messages[:] = live
+        self._state.archived_message_count += len(archived)
+        # Their upserts are still in the log until it is truncated
+        self._state.last_archived_ids = [msg.id for msg in archived]
+
+    def _append_to_log(self, entry: str):
+        """Hand an entry for the human-readable conversation log to its writer."""
+        if self._log_writer is None:
+            self._log_writer = _LogWriter(self.conversation_log)
+        self._log_writer.write((entry + "\n\n").encode("utf-8"))
 
     @property
     def state(self) -> ConversationState:
@@ -74,7 +640,25 @@ class StateManager:
         in_reply_to: Optional[str] = None,
     ) -> Message:
         """Send a message from one agent to another (or broadcast if to_agent is None)."""
-        msg = Message(
+        return self._send_message(
+            from_agent, to_agent, content, message_type, priority, in_reply_to
+        )
+
+    def _send_message(
+        self,
+        from_agent: AgentRole,
+        to_agent: Optional[AgentRole],
+        content: str,
+        message_type: MessageType = MessageType.TASK,
+        priority: Priority = Priority.NORMAL,
+        in_reply_to: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> Message:
+        """send_message without the coroutine, for operations that also
+        post a message; their changes then share one flush (and, given
+        timestamp, one time stamp)."""
+        msg = Message.model_construct(
+            timestamp=timestamp or utcnow(),
             from_agent=from_agent,
             to_agent=to_agent,
             content=content,
@@ -83,11 +667,14 @@ class StateManager:
             in_reply_to=in_reply_to,
         )
         self.state.messages.append(msg)
-        await self._save()
+        self._messages_by_id[msg.id] = msg
+        for role in self._recipients(msg):
+            self._unread_by_agent[role][msg.id] = msg
+        self._record_upsert("messages", msg)
 
         # Log to conversation file
         target = to_agent.value if to_agent else "ALL"
-        await self._append_to_log(
+        self._append_to_log(
             f"---\n**[{msg.timestamp.isoformat()}]** `{from_agent.value}` → `{target}` ({message_type.value})\n\n{content}"
         )
 
@@ -95,6 +682,9 @@ class StateManager:
 
     async def get_inbox(self, agent: AgentRole, unread_only: bool = True) -> list[Message]:
         """Get messages for a specific agent."""
+        if unread_only:
+            return list(self._unread_by_agent[agent].values())
+
         messages = []
         for msg in self.state.messages:
             # Message is for this agent if: direct message OR broadcast (to_agent is None)
@@ -103,22 +693,22 @@ class StateManager:
             is_from_self = msg.from_agent == agent
 
             if is_for_agent and not is_from_self:
-                if unread_only and msg.read:
-                    continue
                 messages.append(msg)
 
         return messages
 
     async def mark_read(self, message_id: str, agent: AgentRole):
         """Mark a message as read by an agent."""
-        for msg in self.state.messages:
-            if msg.id == message_id:
-                msg.read = True
-                break
-        await self._save()
+        msg = self._messages_by_id.get(message_id)
+        if msg is not None:
+            msg.read = True
+            # Read is shared: a broadcast read by one agent leaves every inbox
+            for role in self._recipients(msg):
+                self._unread_by_agent[role].pop(message_id, None)
+            self._record({"op": "read", "id": message_id})
 
     async def get_conversation(self, limit: int = 50) -> list[Message]:
-        """Get recent conversation history."""
+        """Get recent conversation history (at most the live messages)."""
         return self.state.messages[-limit:]
 
     # ─────────────────────────────────────────────────────────────
@@ -134,7 +724,10 @@ class StateManager:
         dependencies: Optional[list[str]] = None,
     ) -> Task:
         """Create a new task."""
-        task = Task(
+        now = utcnow()
+        task = Task.model_construct(
+            created_at=now,
+            updated_at=now,
             title=title,
             description=description,
             created_by=created_by,
@@ -142,9 +735,10 @@ class StateManager:
             dependencies=dependencies or [],
         )
         self.state.tasks.append(task)
-        await self._save()
+        self._index_task(task)
+        self._record_upsert("tasks", task)
 
-        await self._append_to_log(
+        self._append_to_log(
             f"---\n**[TASK CREATED]** `{task.id}` by `{created_by.value}`\n\n"
             f"**Title:** {title}\n**Assigned:** {assigned_to.value if assigned_to else 'Unassigned'}\n\n{description}"
         )
@@ -153,28 +747,27 @@ class StateManager:
 
     async def claim_task(self, task_id: str, agent: AgentRole) -> Optional[Task]:
         """Claim a task for work. Returns None if already claimed."""
-        for task in self.state.tasks:
-            if task.id == task_id:
-                if task.claimed_by is not None and task.claimed_by != agent:
-                    return None  # Already claimed by someone else
-
-                # Check dependencies
-                for dep_id in task.dependencies:
-                    dep_task = await self.get_task(dep_id)
-                    if dep_task and dep_task.status != TaskStatus.COMPLETED:
-                        return None  # Dependency not complete
-
-                task.claimed_by = agent
-                task.status = TaskStatus.IN_PROGRESS
-                task.updated_at = datetime.utcnow()
-                await self._save()
-
-                await self._append_to_log(
-                    f"---\n**[TASK CLAIMED]** `{task_id}` claimed by `{agent.value}`"
-                )
-                return task
-
-        return None
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return None
+        if task.claimed_by is not None and task.claimed_by != agent:
+            return None  # Already claimed by someone else
+
+        # Check dependencies
+        for dep_id in task.dependencies:
+            dep_task = self._tasks_by_id.get(dep_id)
+            if dep_task and dep_task.status != TaskStatus.COMPLETED:
+                return None  # Dependency not complete
+
+        task.claimed_by = agent
+        self._set_task_status(task, TaskStatus.IN_PROGRESS)
+        task.updated_at = utcnow()
+        self._record_upsert("tasks", task)
+
+        self._append_to_log(
+            f"---\n**[TASK CLAIMED]** `{task_id}` claimed by `{agent.value}`"
+        )
+        return task
 
     async def complete_task(
         self,
@@ -184,31 +777,25 @@ class StateManager:
         files_modified: Optional[list[str]] = None,
     ) -> Optional[Task]:
         """Mark a task as complete with result."""
-        for task in self.state.tasks:
-            if task.id == task_id:
-                if task.claimed_by != agent:
-                    return None  # Not claimed by this agent
-
-                task.status = TaskStatus.COMPLETED
-                task.result = result
-                task.files_modified = files_modified or []
-                task.updated_at = datetime.utcnow()
-                await self._save()
-
-                await self._append_to_log(
-                    f"---\n**[TASK COMPLETED]** `{task_id}` by `{agent.value}`\n\n"
-                    f"**Result:**\n{result}\n\n**Files:** {', '.join(files_modified or [])}"
-                )
-                return task
-
-        return None
+        task = self._tasks_by_id.get(task_id)
+        if task is None or task.claimed_by != agent:
+            return None  # Unknown, or not claimed by this agent
+
+        self._set_task_status(task, TaskStatus.COMPLETED)
+        task.result = result
+        task.files_modified = files_modified or []
+        task.updated_at = utcnow()
+        self._record_upsert("tasks", task)
+
+        self._append_to_log(
+            f"---\n**[TASK COMPLETED]** `{task_id}` by `{agent.value}`\n\n"
+            f"**Result:**\n{result}\n\n**Files:** {', '.join(files_modified or [])}"
+        )
+        return task
 
     async def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
-        for task in self.state.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks_by_id.get(task_id)
 
     async def get_tasks(
         self,
@@ -216,12 +803,16 @@ class StateManager:
         assigned_to: Optional[AgentRole] = None,
     ) -> list[Task]:
         """Get tasks, optionally filtered."""
-        tasks = self.state.tasks
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-        if assigned_to:
-            tasks = [t for t in tasks if t.assigned_to == assigned_to]
-        return tasks
+        if not status and not assigned_to:
+            return self.state.tasks
+        if status and assigned_to:
+            ids = self._tasks_by_status[status] & self._tasks_by_assignee[assigned_to]
+        elif status:
+            ids = self._tasks_by_status[status]
+        else:
+            ids = self._tasks_by_assignee[assigned_to]
+        by_id = self._tasks_by_id
+        return [by_id[i] for i in sorted(ids, key=self._task_positions.__getitem__)]
 
     # ─────────────────────────────────────────────────────────────
     # Review Operations
@@ -236,7 +827,9 @@ class StateManager:
         files: Optional[list[str]] = None,
     ) -> ReviewRequest:
         """Request a code review from another agent."""
-        review = ReviewRequest(
+        now = utcnow()
+        review = ReviewRequest.model_construct(
+            timestamp=now,
             from_agent=from_agent,
             to_agent=to_agent,
             task_id=task_id,
@@ -244,15 +837,18 @@ class StateManager:
             files=files or [],
         )
         self.state.reviews.append(review)
-        await self._save()
+        self._reviews_by_id[review.id] = review
+        self._pending_reviews_by_agent[to_agent][review.id] = review
+        self._record_upsert("reviews", review)
 
         # Also send as message
-        await self.send_message(
+        self._send_message(
             from_agent=from_agent,
             to_agent=to_agent,
             content=f"[REVIEW REQUEST {review.id}]\n\n{content}",
             message_type=MessageType.REVIEW_REQUEST,
             priority=Priority.HIGH,
+            timestamp=now,
         )
 
         return review
@@ -265,62 +861,98 @@ class StateManager:
         feedback: str,
     ) -> Optional[ReviewRequest]:
         """Submit a review verdict."""
-        for review in self.state.reviews:
-            if review.id == review_id and review.to_agent == agent:
-                review.verdict = verdict
-                review.feedback = feedback
-                await self._save()
+        review = self._reviews_by_id.get(review_id)
+        if review is None or review.to_agent != agent:
+            return None
 
-                # Send result back
-                await self.send_message(
-                    from_agent=agent,
-                    to_agent=review.from_agent,
-                    content=f"[REVIEW RESULT {review_id}]\n\n**Verdict:** {verdict}\n\n{feedback}",
-                    message_type=MessageType.REVIEW_RESULT,
-                    priority=Priority.HIGH,
-                )
+        self._pending_reviews_by_agent[agent].pop(review_id, None)
+        review.verdict = verdict
+        review.feedback = feedback
+        self._record_upsert("reviews", review)
+
+        # Send result back
+        self._send_message(
+            from_agent=agent,
+            to_agent=review.from_agent,
+            content=f"[REVIEW RESULT {review_id}]\n\n**Verdict:** {verdict}\n\n{feedback}",
+            message_type=MessageType.REVIEW_RESULT,
+            priority=Priority.HIGH,
+        )
 
-                return review
-        return None
+        return review
 
     async def get_pending_reviews(self, agent: AgentRole) -> list[ReviewRequest]:
         """Get reviews pending for an agent."""
-        return [r for r in self.state.reviews if r.to_agent == agent and r.verdict is None]
+        return list(self._pending_reviews_by_agent[agent].values())
 
     # ─────────────────────────────────────────────────────────────
     # Context Operations
     # ─────────────────────────────────────────────────────────────
 
+    def _join_context(self, key: Optional[str] = None):
+        """Fold appended chunks into state.context (for one key, or all)."""
+        keys = list(self._context_chunks) if key is None else [key]
+        for k in keys:
+            chunks = self._context_chunks.pop(k, None)
+            if chunks is not None:
+                del self._context_lengths[k]
+                self._state.context[k] = "\n".join(chunks)
+
     async def set_context(self, key: str, value: str):
         """Set a shared context value."""
+        self._context_chunks.pop(key, None)
+        self._context_lengths.pop(key, None)
         self.state.context[key] = value
-        await self._save()
+        self._record({"op": "context", "key": key, "value": value})
 
     async def get_context(self, key: str) -> Optional[str]:
         """Get a shared context value."""
-        return self.state.context.get(key)
+        self._join_context(key)
+        return self._state.context.get(key)
 
     async def append_context(self, key: str, value: str):
-        """Append to a shared context value."""
-        existing = self.state.context.get(key, "")
-        self.state.context[key] = existing + "\n" + value if existing else value
-        await self._save()
+        """Append to a shared context value.
+
+        The event carries the value's length before the append, which lets
+        replay skip it when the snapshot already includes it.
+        """
+        chunks = self._context_chunks.get(key)
+        if chunks is None:
+            existing = self._state.context.get(key, "")
+            chunks = self._context_chunks[key] = [existing]
+            self._context_lengths[key] = len(existing)
+        at = self._context_lengths[key]
+        if at:
+            chunks.append(value)
+            self._context_lengths[key] = at + 1 + len(value)
+        else:
+            chunks[:] = [value]  # Appending to an empty value replaces it
+            self._context_lengths[key] = len(value)
+        self._record({"op": "append", "key": key, "value": value, "at": at})
 
     async def get_all_context(self) -> dict[str, str]:
         """Get all shared context."""
-        return self.state.context.copy()
+        self._join_context()
+        return self._state.context.copy()
 
     # ─────────────────────────────────────────────────────────────
     # Voting Operations
     # ─────────────────────────────────────────────────────────────
 
-    async def create_vote(self, topic: str, options: list[str]) -> Vote:
-        """Create a vote for agents to participate in."""
-        vote = Vote(topic=topic, options=options)
+    async def create_vote(self, topic: str, options: list[str]) -> Optional[Vote]:
+        """Create a vote for agents to participate in.
+
+        Votes are identified by topic, so a topic that already has a vote
+        returns None instead of creating a second one.
+        """
+        if topic in self._votes_by_topic:
+            return None
+        vote = Vote.model_construct(topic=topic, options=options)
         self.state.active_votes.append(vote)
-        await self._save()
+        self._votes_by_topic[topic] = vote
+        self._record_upsert("active_votes", vote)
 
-        await self.send_message(
+        self._send_message(
             from_agent=AgentRole.CLAUDE,  # Votes initiated by orchestrator
             to_agent=None,  # Broadcast
             content=f"[VOTE] {topic}\n\nOptions: {', '.join(options)}\n\nPlease vote!",
@@ -331,13 +963,12 @@ class StateManager:
 
     async def cast_vote(self, topic: str, agent: AgentRole, choice: str) -> Optional[Vote]:
         """Cast a vote."""
-        for vote in self.state.active_votes:
-            if vote.topic == topic:
-                if choice in vote.options:
-                    vote.votes[agent.value] = choice
-                    await self._save()
-                    return vote
-        return None
+        vote = self._votes_by_topic.get(topic)
+        if vote is None or choice not in vote.options:
+            return None
+        vote.votes[agent.value] = choice
+        self._record_upsert("active_votes", vote)
+        return vote
 
     # ─────────────────────────────────────────────────────────────
     # Escalation
@@ -347,13 +978,16 @@ class StateManager:
         """Request human intervention."""
         self.state.human_intervention_requested = True
         self.state.escalation_reason = reason
-        await self._save()
+        self._record({"op": "set", "fields": {
+            "human_intervention_requested": True,
+            "escalation_reason": reason,
+        }})
 
-        await self._append_to_log(
+        self._append_to_log(
             f"---\n**[ESCALATION]** `{agent.value}` requests human intervention\n\n{reason}"
         )
 
-        await self.send_message(
+        self._send_message(
             from_agent=agent,
             to_agent=None,
             content=f"[ESCALATION] Human intervention requested: {reason}",
@@ -365,7 +999,10 @@ class StateManager:
         """Clear escalation after human intervenes."""
         self.state.human_intervention_requested = False
         self.state.escalation_reason = None
-        await self._save()
+        self._record({"op": "set", "fields": {
+            "human_intervention_requested": False,
+            "escalation_reason": None,
+        }})
 
     # ─────────────────────────────────────────────────────────────
     # Session Management
@@ -374,40 +1011,51 @@ class StateManager:
     async def set_initial_prompt(self, prompt: str):
         """Set the initial user prompt for this session."""
         self.state.initial_prompt = prompt
-        await self._save()
+        self._record({"op": "set", "fields": {"initial_prompt": prompt}})
 
-        await self._append_to_log(
+        self._append_to_log(
             f"# Orchestra Session `{self.state.session_id}`\n\n"
             f"**Started:** {self.state.started_at.isoformat()}\n\n"
             f"## Initial Prompt\n\n{prompt}"
         )
 
     async def reset(self):
-        """Reset state for a new session."""
+        """Reset state for a new session.
+
+        The finished session's conversation log is kept, renamed to
+        conversation.<unix time>-<session id>.md.
+        """
+        rotated = self.conversation_log.with_suffix(
+            f".{int(time.time())}-{self.state.session_id}.md"
+        )
         self._state = ConversationState()
+        self._index_state()
+        self._context_chunks.clear()
+        self._context_lengths.clear()
         await self._save()
 
-        # Clear conversation log
-        if self.conversation_log.exists():
-            self.conversation_log.unlink()
+        if self._log_writer is not None:
+            self._log_writer.rotate(rotated)
+        elif self.conversation_log.exists():
+            await asyncio.to_thread(os.replace, self.conversation_log, rotated)
+        if self.archive_file.exists():
+            self.archive_file.unlink()
 
     async def get_status(self) -> dict:
         """Get current orchestration status."""
-        pending_tasks = len([t for t in self.state.tasks if t.status == TaskStatus.PENDING])
-        in_progress = len([t for t in self.state.tasks if t.status == TaskStatus.IN_PROGRESS])
-        completed = len([t for t in self.state.tasks if t.status == TaskStatus.COMPLETED])
+        by_status = self._tasks_by_status
 
         return {
             "session_id": self.state.session_id,
             "started_at": self.state.started_at.isoformat(),
-            "message_count": len(self.state.messages),
+            "message_count": self.state.archived_message_count + len(self.state.messages),
             "tasks": {
-                "pending": pending_tasks,
-                "in_progress": in_progress,
-                "completed": completed,
+                "pending": len(by_status[TaskStatus.PENDING]),
+                "in_progress": len(by_status[TaskStatus.IN_PROGRESS]),
+                "completed": len(by_status[TaskStatus.COMPLETED]),
                 "total": len(self.state.tasks),
             },
-            "pending_reviews": len([r for r in self.state.reviews if r.verdict is None]),
+            "pending_reviews": sum(map(len, self._pending_reviews_by_agent.values())),
             "human_intervention_requested": self.state.human_intervention_requested,
             "escalation_reason": self.state.escalation_reason,
         }
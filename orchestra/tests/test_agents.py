@@ -0,0 +1,53 @@
+"""Tests for agent CLI process handling."""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+from orchestra import agents
+from orchestra.models import AgentRole
+
+
+def _alive(pid: int) -> bool:
+    """Whether pid is a running (not zombie) process."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reads /proc")
+def test_cancelled_invoke_kills_the_agent(tmp_path, monkeypatch):
+    pid_file = tmp_path / "child.pid"
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    codex = bin_dir / "codex"
+    # The CLI starts a helper that holds its output pipes, like real agents
+    codex.write_text(f"#!/bin/sh\nsleep 30 &\necho $! > {pid_file}\nwait\n")
+    codex.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    agents._which.cache_clear()
+
+    async def run():
+        invoke = asyncio.create_task(
+            agents.AgentPool(str(tmp_path)).invoke(AgentRole.CODEX, "work")
+        )
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            await asyncio.sleep(0.01)
+        invoke.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await invoke
+
+    try:
+        asyncio.run(run())
+    finally:
+        agents._which.cache_clear()
+    child = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while _alive(child) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not _alive(child)
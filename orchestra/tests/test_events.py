@@ -0,0 +1,141 @@
+"""Replay tests for the state event log."""
+
+import asyncio
+import time
+
+import orjson
+
+from orchestra.events import apply_events
+from orchestra.models import AgentRole, ConversationState
+from orchestra import state
+from orchestra.state import StateManager
+
+
+async def _populate(sm: StateManager):
+    """Make at least one change of every event type."""
+    await sm.set_initial_prompt("build it")
+    task = await sm.create_task("a", "first", AgentRole.CLAUDE)
+    await sm.create_task("b", "second", AgentRole.CLAUDE, dependencies=[task.id])
+    await sm.claim_task(task.id, AgentRole.CODEX)
+    await sm.complete_task(task.id, AgentRole.CODEX, "done", ["a.py"])
+    msg = await sm.send_message(AgentRole.CLAUDE, AgentRole.GEMINI, "hi")
+    await sm.send_message(AgentRole.CLAUDE, None, "all")
+    await sm.mark_read(msg.id, AgentRole.GEMINI)
+    review = await sm.request_review(AgentRole.CLAUDE, AgentRole.CODEX, "look")
+    await sm.submit_review(review.id, AgentRole.CODEX, "APPROVED", "fine")
+    await sm.set_context("notes", "one")
+    await sm.append_context("notes", "two")
+    await sm.append_context("plan", "start")
+    await sm.create_vote("db", ["sqlite", "postgres"])
+    await sm.cast_vote("db", AgentRole.GEMINI, "sqlite")
+    await sm.escalate_to_human(AgentRole.CODEX, "stuck")
+
+
+def _replay(state_dir) -> dict:
+    """Rebuild the state from state.json and events.jsonl on disk."""
+    data = orjson.loads((state_dir / "state.json").read_bytes())
+    apply_events(data, (state_dir / "events.jsonl").read_bytes().splitlines())
+    return ConversationState.model_validate(data).model_dump(mode="json")
+
+
+def test_replay_matches_live_state(tmp_path):
+    async def run():
+        sm = StateManager(str(tmp_path))
+        await sm.initialize()
+        await _populate(sm)
+        await sm.get_all_context()
+        await sm.close()
+        return sm.state.model_dump(mode="json")
+
+    live = asyncio.run(run())
+    assert _replay(tmp_path) == live
+
+
+def test_replaying_covered_events_is_harmless(tmp_path, monkeypatch):
+    """A crash between the snapshot and the log truncation replays events
+    the snapshot already holds, including those of archived messages."""
+    monkeypatch.setattr(state, "MAX_LIVE_MESSAGES", 3)
+
+    async def run():
+        sm = StateManager(str(tmp_path))
+        await sm.initialize()
+        await _populate(sm)
+        for i in range(5):
+            msg = await sm.send_message(AgentRole.GEMINI, AgentRole.CLAUDE, f"m{i}")
+            await sm.mark_read(msg.id, AgentRole.CLAUDE)
+        await sm.close()
+        lines = (tmp_path / "events.jsonl").read_bytes().splitlines()
+        await sm._save()
+        return sm.state, lines
+
+    live, lines = asyncio.run(run())
+    assert live.last_archived_ids
+    data = orjson.loads((tmp_path / "state.json").read_bytes())
+    apply_events(data, lines)
+    apply_events(data, lines)
+    replayed = ConversationState.model_validate(data)
+    assert replayed.model_dump(mode="json") == live.model_dump(mode="json")
+    sent = {
+        event["item"]["id"]
+        for event in map(orjson.loads, lines)
+        if event["op"] == "upsert" and event["kind"] == "messages"
+    }
+    assert replayed.archived_message_count + len(replayed.messages) == len(sent)
+
+
+def test_reload_matches_live_state(tmp_path):
+    async def run():
+        sm = StateManager(str(tmp_path))
+        await sm.initialize()
+        await _populate(sm)
+        await sm.get_all_context()
+        await sm.close()
+        reloaded = StateManager(str(tmp_path))
+        await reloaded.initialize()
+        await reloaded.close()
+        return sm.state, reloaded.state
+
+    live, reloaded = asyncio.run(run())
+    assert reloaded == live
+
+
+def test_duplicate_vote_topic_is_rejected(tmp_path):
+    async def run():
+        sm = StateManager(str(tmp_path))
+        await sm.initialize()
+        first = await sm.create_vote("db", ["sqlite", "postgres"])
+        second = await sm.create_vote("db", ["mysql"])
+        await sm.cast_vote("db", AgentRole.GEMINI, "sqlite")
+        await sm.close()
+        reloaded = StateManager(str(tmp_path))
+        await reloaded.initialize()
+        await reloaded.close()
+        return first, second, reloaded.state.active_votes
+
+    first, second, votes = asyncio.run(run())
+    assert first is not None
+    assert second is None
+    assert len(votes) == 1
+    assert votes[0].options == ["sqlite", "postgres"]
+    assert votes[0].votes == {"gemini": "sqlite"}
+
+
+def test_close_lets_an_in_flight_append_finish(tmp_path, monkeypatch):
+    append_bytes = state._append_bytes
+
+    def slow_append(path, data):
+        time.sleep(0.3)
+        append_bytes(path, data)
+
+    monkeypatch.setattr(state, "_append_bytes", slow_append)
+
+    async def run():
+        sm = StateManager(str(tmp_path))
+        await sm.initialize()
+        await sm.send_message(AgentRole.CLAUDE, AgentRole.GEMINI, "first")
+        await asyncio.sleep(state.FLUSH_DELAY + 0.1)  # flusher is mid-append
+        await sm.send_message(AgentRole.CLAUDE, AgentRole.GEMINI, "second")
+        await sm.close()
+
+    asyncio.run(run())
+    assert len((tmp_path / "events.jsonl").read_bytes().splitlines()) == 2
@@ -0,0 +1,96 @@
+"""Tests for StateManager instances sharing one state directory."""
+
+import asyncio
+import multiprocessing
+
+from orchestra import state
+from orchestra.models import AgentRole, TaskStatus
+from orchestra.state import StateManager
+
+
+def _send_messages(state_dir: str, sender: str, count: int):
+    state.SNAPSHOT_EVERY = 20  # Snapshot while the other process writes
+
+    async def run():
+        sm = StateManager(state_dir)
+        await sm.initialize()
+        for i in range(count):
+            async with sm.transaction():
+                await sm.send_message(AgentRole(sender), None, f"{sender} {i}")
+        await sm.close()
+
+    asyncio.run(run())
+
+
+def test_refresh_sees_other_managers_changes(tmp_path):
+    async def run():
+        first = StateManager(str(tmp_path))
+        second = StateManager(str(tmp_path))
+        await first.initialize()
+        await second.initialize()
+        async with first.transaction():
+            task = await first.create_task("a", "d", AgentRole.CLAUDE)
+        await second.refresh()
+        async with second.transaction():
+            claimed = await second.claim_task(task.id, AgentRole.CODEX)
+        async with first.transaction():
+            again = await first.claim_task(task.id, AgentRole.GEMINI)
+        await first.close()
+        await second.close()
+        return claimed, again, first.state.tasks
+
+    claimed, again, tasks = asyncio.run(run())
+    assert claimed is not None
+    assert again is None
+    assert tasks[0].status == TaskStatus.IN_PROGRESS
+    assert tasks[0].claimed_by == AgentRole.CODEX
+
+
+def test_processes_share_state_across_snapshots(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(target=_send_messages, args=(str(tmp_path), role, 60))
+        for role in ("claude", "gemini")
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+
+    async def load():
+        sm = StateManager(str(tmp_path))
+        await sm.initialize()
+        await sm.close()
+        return sm.state.messages
+
+    messages = asyncio.run(load())
+    assert len(messages) == 120
+    for role in ("claude", "gemini"):
+        sent = [m.content for m in messages if m.from_agent == AgentRole(role)]
+        assert sent == [f"{role} {i}" for i in range(60)]
+
+
+def test_log_follows_another_managers_reset(tmp_path):
+    async def run():
+        first = StateManager(str(tmp_path))
+        second = StateManager(str(tmp_path))
+        await first.initialize()
+        await second.initialize()
+        async with second.transaction():
+            await second.send_message(AgentRole.GEMINI, None, "before reset")
+        log = tmp_path / "conversation.md"
+        while not log.exists() or "before reset" not in log.read_text():
+            await asyncio.sleep(0.01)  # the log thread writes it shortly
+        async with first.transaction():
+            await first.reset()
+        await first.close()
+        async with second.transaction():
+            await second.send_message(AgentRole.GEMINI, None, "after reset")
+        await second.close()
+
+    asyncio.run(run())
+    (rotated,) = tmp_path.glob("conversation.*-*.md")
+    assert "before reset" in rotated.read_text()
+    assert "after reset" not in rotated.read_text()
+    assert "after reset" in (tmp_path / "conversation.md").read_text()
@@ -1,15 +1,46 @@
+import asyncio
 import subprocess
 import json
+import re
+import shutil
 import sys
 import os
 
-def run_loop(task):
-    # Paths to agents
-    # Assuming this script is run from project root, and scripts are in .skills/
-    # Use forward slashes for bash compatibility on Windows
-    gemini_agent = ".skills/gemini.agent.wrapper.sh"
-    codex_agent = ".skills/codex.agent.wrapper.sh"
-    copilot_agent = ".skills/copilot.agent.wrapper.sh"
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser reads memory.json too
+    orjson = None
+
+# Paths to agents
+# Assuming this script is run from project root, and scripts are in .skills/
+# Use forward slashes for bash compatibility on Windows
+GEMINI_AGENT = ".skills/gemini.agent.wrapper.sh"
+CODEX_AGENT = ".skills/codex.agent.wrapper.sh"
+COPILOT_AGENT = ".skills/copilot.agent.wrapper.sh"
+# gemini.agent.wrapper.sh saves its analysis here
+MEMORY_FILE = os.path.join(".skills", "memory.json")
+# Resolved once so each agent launch skips the PATH search
+BASH = shutil.which("bash") or "bash"
+# Tasks that go to Codex (UI/visual work). "UI" stays case-sensitive so
+# "GUI", "UIs" and "SwiftUI" match but "build" and "guide" don't
+UI_TASK = re.compile(
+    r"(?-i:UI)|screen|design|layout|\bcss\b|figma|mockup", re.IGNORECASE
+)
+
+def _preflight_builder(agent):
+    """Check the builder's wrapper is in place; runs while Gemini analyzes."""
+    return os.path.isfile(agent)
+
+async def run_loop(task):
+    # Decide who builds (Simple logic). This only depends on the task, so
+    # the builder can be checked while Gemini is still working.
+    if UI_TASK.search(task):
+        agent = CODEX_AGENT
+        agent_name = "Codex"
+    else:
+        agent = COPILOT_AGENT
+        agent_name = "Copilot"
+    preflight = asyncio.create_task(asyncio.to_thread(_preflight_builder, agent))
 
     # 1. Ask Gemini to Analyze
     print("👀 Asking Gemini to analyze...")
@@ -23,13 +54,15 @@ def run_loop(task):
         # Assuming the user has a bash environment (since they provided bash scripts).
         
         # We'll use 'bash' to run the scripts.
-        subprocess.check_call(["bash", gemini_agent, task])
+        gemini = await asyncio.create_subprocess_exec(BASH, GEMINI_AGENT, task)
+        if await gemini.wait():
+            raise subprocess.CalledProcessError(gemini.returncode, [BASH, GEMINI_AGENT, task])
         
         # Read from shared memory
-        memory_file = os.path.join(".skills", "memory.json")
-        with open(memory_file, 'r') as f:
-            memory = json.load(f)
-            analysis = memory.get("last_analysis", "")
+        with open(MEMORY_FILE, 'rb') as f:
+            raw = f.read()
+        memory = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        analysis = memory.get("last_analysis", "")
             
     except subprocess.CalledProcessError as e:
         print(f"Error running Gemini: {e}")
@@ -38,18 +71,16 @@ def run_loop(task):
         print(f"Error: {e}")
         return
 
-    # 2. Decide who builds (Simple logic)
-    if "UI" in task or "Screen" in task or "design" in task.lower():
-        agent = codex_agent
-        agent_name = "Codex"
-    else:
-        agent = copilot_agent
-        agent_name = "Copilot"
-        
-    # 3. Execute Builder
+    # 2. Execute Builder
     print(f"🛠️ Delegating to {agent_name}...")
+    if not await preflight:
+        print(f"Error running {agent_name}: wrapper not found: {agent}")
+        return
     try:
-        subprocess.run(["bash", agent, f"Task: {task}", f"Context: {analysis}"])
+        builder = await asyncio.create_subprocess_exec(
+            BASH, agent, f"Task: {task}", f"Context: {analysis}"
+        )
+        await builder.wait()
     except Exception as e:
          print(f"Error running {agent_name}: {e}")
 
@@ -59,4 +90,4 @@ if __name__ == "__main__":
         sys.exit(1)
         
     task_description = sys.argv[1]
-    run_loop(task_description)
+    asyncio.run(run_loop(task_description))